@@ -5,12 +5,14 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, Platform
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.entity import DeviceInfo
 
 from .keba_kecontact import KebaClient, KebaUdpManager
 from .coordinator import KebaChargingCoordinator
+from .sensor import KebaDataUpdateCoordinator
 
 from .const import (
     CONF_IP_ADDRESS,
@@ -38,6 +40,8 @@ PLATFORMS: list[Platform] = [
     Platform.NOTIFY,
 ]
 
+DATA_COORDINATOR_CHECK_SCHEDULED = "coordinator_check_scheduled"
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Keba KeContact from a config entry."""
@@ -51,9 +55,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_setup_charger_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a Keba charger from a config entry."""
-    from .sensor import KebaDataUpdateCoordinator
-    from homeassistant.helpers.entity import DeviceInfo
-
     ip_address = entry.data[CONF_IP_ADDRESS]
 
     manager = KebaUdpManager.get_instance()
@@ -70,13 +71,6 @@ async def async_setup_charger_entry(hass: HomeAssistant, entry: ConfigEntry) ->
 
     try:
         await client.connect()
-        report1 = await client.get_report_1()
-        _LOGGER.info(
-            "Connected to Keba charger at %s (Serial: %s, Product: %s)",
-            ip_address,
-            report1.serial,
-            report1.product,
-        )
     except Exception as err:
         _LOGGER.error("Failed to connect to charger at %s: %s", ip_address, err)
         await client.disconnect()
@@ -96,6 +90,12 @@ async def async_setup_charger_entry(hass: HomeAssistant, entry: ConfigEntry) ->
         ) from err
 
     serial = coordinator.data.get("serial")
+    _LOGGER.info(
+        "Connected to Keba charger at %s (Serial: %s, Product: %s)",
+        ip_address,
+        serial,
+        coordinator.data.get("product"),
+    )
     device_name = entry.title if entry.title else f"Keba KeContact {serial}" if serial else f"Keba KeContact {ip_address}"
 
     device_info = DeviceInfo(
@@ -120,26 +120,73 @@ async def async_setup_charger_entry(hass: HomeAssistant, entry: ConfigEntry) ->
 
     saved_current_limit = entry.options.get("current_limit")
     if saved_current_limit is not None:
-        try:
-            milliamps = int(saved_current_limit * 1000)
-            await client.set_current(milliamps)
-            _LOGGER.info(
-                "Applied saved Current Limit %.1f A to charger at %s",
-                saved_current_limit,
-                ip_address
-            )
-        except Exception as err:
-            _LOGGER.warning(
-                "Failed to apply saved Current Limit to charger at %s: %s",
-                ip_address,
-                err
-            )
+        entry.async_create_background_task(
+            hass,
+            _apply_saved_current_limit(client, saved_current_limit),
+            f"{DOMAIN}_apply_current_limit_{ip_address}",
+        )
 
-    await _check_and_create_coordinator(hass)
+    _schedule_coordinator_check(hass, entry)
 
     return True
 
 
+async def _apply_saved_current_limit(client: KebaClientType, current_limit: float) -> None:
+    """Apply the persisted Current Limit to a charger after setup."""
+    try:
+        milliamps = int(current_limit * 1000)
+        await client.set_current(milliamps)
+        _LOGGER.info(
+            "Applied saved Current Limit %.1f A to charger at %s",
+            current_limit,
+            client.ip_address
+        )
+    except Exception as err:
+        _LOGGER.warning(
+            "Failed to apply saved Current Limit to charger at %s: %s",
+            client.ip_address,
+            err
+        )
+
+
+@callback
+def _schedule_coordinator_check(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Run the automatic coordinator check once all entries have loaded.
+
+    During startup every charger entry lands here; only the first one
+    registers a listener so the config entries are scanned a single time
+    after Home Assistant has started. Chargers added later are checked
+    right away. If that entry unloads before startup completes, the
+    listener is removed and the next charger entry schedules the check.
+    """
+    if hass.is_running:
+        hass.async_create_task(_check_and_create_coordinator(hass))
+        return
+
+    if hass.data[DOMAIN].get(DATA_COORDINATOR_CHECK_SCHEDULED):
+        return
+    hass.data[DOMAIN][DATA_COORDINATOR_CHECK_SCHEDULED] = True
+
+    unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_on_started(event: Event) -> None:
+        nonlocal unsub
+        unsub = None
+        hass.data[DOMAIN].pop(DATA_COORDINATOR_CHECK_SCHEDULED, None)
+        hass.async_create_task(_check_and_create_coordinator(hass))
+
+    @callback
+    def _async_cancel() -> None:
+        if unsub is None:
+            return
+        unsub()
+        hass.data.get(DOMAIN, {}).pop(DATA_COORDINATOR_CHECK_SCHEDULED, None)
+
+    unsub = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_on_started)
+    entry.async_on_unload(_async_cancel)
+
+
 async def _check_and_create_coordinator(hass: HomeAssistant) -> None:
     """Check if we should create a coordinator automatically."""
     charger_entries = []
@@ -173,8 +220,6 @@ async def _check_and_create_coordinator(hass: HomeAssistant) -> None:
 
 async def async_setup_coordinator_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a Keba Charging Coordinator from a config entry."""
-    from homeassistant.helpers.entity import DeviceInfo
-
     name = entry.data[CONF_COORDINATOR_NAME]
     charger_entry_ids = entry.data[CONF_COORDINATOR_CHARGERS]
     max_current = entry.options.get(
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Callable
+from operator import methodcaller
+from typing import Callable, Collection
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -17,6 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .coordinator_binary_sensor import async_setup_entry as async_setup_coordinator_binary_sensors
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,70 +28,52 @@ PLUG_STATION_LOCKED = 3
 PLUG_STATION_EV = 5
 PLUG_STATION_EV_LOCKED = 7
 
+PLUG_LOCKED_BIT = 0x02
+PLUG_EV_BIT = 0x04
+
 STATE_CHARGING = 3
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class KebaBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes Keba binary sensor entity."""
 
     value_fn: Callable[[dict], bool | None] = lambda data: None
 
 
-def _is_plugged_on_ev(data: dict) -> bool | None:
-    """Check if cable is plugged to EV."""
-    plug = data.get("plug")
-    return plug in [PLUG_STATION_EV, PLUG_STATION_EV_LOCKED] if plug is not None else None
-
-
-def _is_charging(data: dict) -> bool | None:
-    """Check if currently charging."""
-    state = data.get("state")
-    return state == STATE_CHARGING if state is not None else None
-
-
-def _is_enable_user(data: dict) -> bool | None:
-    """Check if user enable is active."""
-    enable_user = data.get("enable_user")
-    return enable_user == 1 if enable_user is not None else None
-
+def _equals(key: str, value: int) -> Callable[[dict], bool | None]:
+    """Build a predicate checking that a data field equals a value."""
 
-def _is_cable_plugged_station(data: dict) -> bool | None:
-    """Check if cable is plugged to station."""
-    plug = data.get("plug")
-    return plug != PLUG_UNPLUGGED if plug is not None else None
+    def _predicate(data: dict) -> bool | None:
+        current = data.get(key)
+        return current == value if current is not None else None
 
+    return _predicate
 
-def _is_cable_locked(data: dict) -> bool | None:
-    """Check if cable is locked."""
-    plug = data.get("plug")
-    return plug in [PLUG_STATION_LOCKED, PLUG_STATION_EV_LOCKED] if plug is not None else None
 
+def _differs(key: str, value: int) -> Callable[[dict], bool | None]:
+    """Build a predicate checking that a data field differs from a value."""
 
-def _is_enable_sys(data: dict) -> bool | None:
-    """Check if system enable is active."""
-    enable_sys = data.get("enable_sys")
-    return enable_sys == 1 if enable_sys is not None else None
+    def _predicate(data: dict) -> bool | None:
+        current = data.get(key)
+        return current != value if current is not None else None
 
+    return _predicate
 
-def _is_failsafe_mode(data: dict) -> bool | None:
-    """Check if failsafe mode is active."""
-    return data.get("failsafe_mode")
 
+def _has_bits(key: str, mask: int) -> Callable[[dict], bool | None]:
+    """Build a predicate checking that a bit-encoded data field has mask set."""
 
-def _is_authreq(data: dict) -> bool | None:
-    """Check if authentication is required."""
-    return data.get("authreq")
+    def _predicate(data: dict) -> bool | None:
+        current = data.get(key)
+        return bool(current & mask) if current is not None else None
 
+    return _predicate
 
-def _is_authon(data: dict) -> bool | None:
-    """Check if authentication is enabled."""
-    return data.get("authon")
 
-
-def _is_x2_phase_switch(data: dict) -> bool | None:
-    """Check X2 phase switch status."""
-    return data.get("x2_phase_switch")
+def _value_of(key: str) -> Callable[[dict], bool | None]:
+    """Build a getter returning a boolean data field as-is."""
+    return methodcaller("get", key)
 
 
 BINARY_SENSOR_TYPES: tuple[KebaBinarySensorEntityDescription, ...] = (
@@ -97,67 +81,76 @@ BINARY_SENSOR_TYPES: tuple[KebaBinarySensorEntityDescription, ...] = (
         key="plugged_on_ev",
         name="Plugged on EV",
         device_class=BinarySensorDeviceClass.PLUG,
-        value_fn=_is_plugged_on_ev,
+        value_fn=_has_bits("plug", PLUG_EV_BIT),
     ),
     KebaBinarySensorEntityDescription(
         key="charging",
         name="Charging",
         device_class=BinarySensorDeviceClass.POWER,
-        value_fn=_is_charging,
+        value_fn=_equals("state", STATE_CHARGING),
     ),
     KebaBinarySensorEntityDescription(
         key="enable_user",
         name="Enable User",
         device_class=BinarySensorDeviceClass.POWER,
-        value_fn=_is_enable_user,
+        value_fn=_equals("enable_user", 1),
     ),
     KebaBinarySensorEntityDescription(
         key="cable_plugged_station",
         name="Cable Plugged on Station",
         device_class=BinarySensorDeviceClass.PLUG,
         entity_registry_enabled_default=False,
-        value_fn=_is_cable_plugged_station,
+        value_fn=_differs("plug", PLUG_UNPLUGGED),
     ),
     KebaBinarySensorEntityDescription(
         key="cable_locked",
         name="Cable Locked",
         device_class=BinarySensorDeviceClass.LOCK,
         entity_registry_enabled_default=False,
-        value_fn=_is_cable_locked,
+        value_fn=_has_bits("plug", PLUG_LOCKED_BIT),
     ),
     KebaBinarySensorEntityDescription(
         key="enable_sys",
         name="Enable System",
         device_class=BinarySensorDeviceClass.POWER,
-        value_fn=_is_enable_sys,
+        value_fn=_equals("enable_sys", 1),
     ),
     KebaBinarySensorEntityDescription(
         key="failsafe_mode",
         name="Failsafe Mode",
         device_class=BinarySensorDeviceClass.SAFETY,
-        value_fn=_is_failsafe_mode,
+        value_fn=_value_of("failsafe_mode"),
     ),
     KebaBinarySensorEntityDescription(
         key="authreq",
         name="Authentication Required",
         entity_registry_enabled_default=False,
-        value_fn=_is_authreq,
+        value_fn=_value_of("authreq"),
     ),
     KebaBinarySensorEntityDescription(
         key="authon",
         name="Authentication Enabled",
         entity_registry_enabled_default=False,
-        value_fn=_is_authon,
+        value_fn=_value_of("authon"),
     ),
     KebaBinarySensorEntityDescription(
         key="x2_phase_switch",
         name="X2 Phase Switch",
         entity_registry_enabled_default=False,
-        value_fn=_is_x2_phase_switch,
+        value_fn=_value_of("x2_phase_switch"),
     ),
 )
 
 
+def compute_binary_sensor_states(data: dict, keys: Collection[str]) -> dict[str, bool | None]:
+    """Evaluate the binary sensor descriptions in keys once for a coordinator update."""
+    return {
+        description.key: description.value_fn(data)
+        for description in BINARY_SENSOR_TYPES
+        if description.key in keys
+    }
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -167,7 +160,6 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
 
     if data.get("type") == "charging_coordinator":
-        from .coordinator_binary_sensor import async_setup_entry as async_setup_coordinator_binary_sensors
         return await async_setup_coordinator_binary_sensors(hass, entry, async_add_entities)
 
     coordinator = data["coordinator"]
@@ -200,7 +192,21 @@ class KebaBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_has_entity_name = True
 
+    async def async_added_to_hass(self) -> None:
+        """Register this sensor's key so the coordinator evaluates it."""
+        await super().async_added_to_hass()
+        key = self.entity_description.key
+        self.coordinator.binary_sensor_keys.add(key)
+        self.coordinator.data["binary_sensors"][key] = self.entity_description.value_fn(
+            self.coordinator.data
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop evaluating this sensor's key on coordinator updates."""
+        self.coordinator.binary_sensor_keys.discard(self.entity_description.key)
+        await super().async_will_remove_from_hass()
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.coordinator.data["binary_sensors"].get(self.entity_description.key)
@@ -9,6 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .keba_kecontact.client import KebaClient
 
@@ -42,7 +43,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class KebaStartChargingButton(ButtonEntity):
+class KebaStartChargingButton(CoordinatorEntity[KebaDataUpdateCoordinator], ButtonEntity):
     """Button to start charging session."""
 
     def __init__(
@@ -53,7 +54,7 @@ class KebaStartChargingButton(ButtonEntity):
         client: KebaClient,
     ) -> None:
         """Initialize the button."""
-        self._coordinator = coordinator
+        super().__init__(coordinator)
         self._client = client
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_start_charging"
@@ -67,18 +68,13 @@ class KebaStartChargingButton(ButtonEntity):
         try:
             await self._client.start_charging()
             _LOGGER.info("Started charging session on %s", self._client.ip_address)
-            await self._coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to start charging on %s: %s", self._client.ip_address, err)
             raise
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self._coordinator.last_update_success
 
-
-class KebaStopChargingButton(ButtonEntity):
+class KebaStopChargingButton(CoordinatorEntity[KebaDataUpdateCoordinator], ButtonEntity):
     """Button to stop charging session."""
 
     def __init__(
@@ -89,7 +85,7 @@ class KebaStopChargingButton(ButtonEntity):
         client: KebaClient,
     ) -> None:
         """Initialize the button."""
-        self._coordinator = coordinator
+        super().__init__(coordinator)
         self._client = client
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_stop_charging"
@@ -103,18 +99,13 @@ class KebaStopChargingButton(ButtonEntity):
         try:
             await self._client.stop_charging()
             _LOGGER.info("Stopped charging session on %s", self._client.ip_address)
-            await self._coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to stop charging on %s: %s", self._client.ip_address, err)
             raise
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self._coordinator.last_update_success
-
 
-class KebaUnlockSocketButton(ButtonEntity):
+class KebaUnlockSocketButton(CoordinatorEntity[KebaDataUpdateCoordinator], ButtonEntity):
     """Button to unlock the socket and release the cable."""
 
     def __init__(
@@ -125,7 +116,7 @@ class KebaUnlockSocketButton(ButtonEntity):
         client: KebaClient,
     ) -> None:
         """Initialize the button."""
-        self._coordinator = coordinator
+        super().__init__(coordinator)
         self._client = client
         self._attr_device_info = device_info
         self._attr_unique_id = f"{entry.entry_id}_unlock_socket"
@@ -139,12 +130,7 @@ class KebaUnlockSocketButton(ButtonEntity):
         try:
             await self._client.unlock_socket()
             _LOGGER.info("Unlocked socket on %s", self._client.ip_address)
-            await self._coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to unlock socket on %s: %s", self._client.ip_address, err)
             raise
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self._coordinator.last_update_success
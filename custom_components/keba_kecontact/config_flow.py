@@ -40,13 +40,15 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_TEXT_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(
+        type=selector.TextSelectorType.TEXT,
+    ),
+)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_IP_ADDRESS): selector.TextSelector(
-            selector.TextSelectorConfig(
-                type=selector.TextSelectorType.TEXT,
-            ),
-        ),
+        vol.Required(CONF_IP_ADDRESS): _TEXT_SELECTOR,
     }
 )
 
@@ -56,6 +58,10 @@ class KebaKeContactConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._client: KebaClient | None = None
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -98,7 +104,13 @@ class KebaKeContactConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 _LOGGER.debug("UDP manager already running")
 
-            client = KebaClient(ip_address, use_global_handler=True)
+            if self._client is not None and self._client.ip_address != ip_address:
+                await self._client.disconnect()
+                self._client = None
+
+            if self._client is None:
+                self._client = KebaClient(ip_address, use_global_handler=True)
+            client = self._client
 
             try:
                 _LOGGER.debug("Connecting to charger at %s", ip_address)
@@ -118,6 +130,7 @@ class KebaKeContactConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 title = f"Keba KeContact ({report1.serial})"
 
                 await client.disconnect()
+                self._client = None
                 _LOGGER.debug("Disconnected from charger after successful validation")
 
                 return self.async_create_entry(
@@ -131,7 +144,6 @@ class KebaKeContactConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     ip_address,
                 )
                 errors["base"] = "timeout_connect"
-                await client.disconnect()
             except Exception as err:
                 _LOGGER.error(
                     "Failed to connect to charger at %s: %s",
@@ -140,7 +152,6 @@ class KebaKeContactConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     exc_info=True,
                 )
                 errors["base"] = "cannot_connect"
-                await client.disconnect()
 
         return self.async_show_form(
             step_id="user",
@@ -148,6 +159,13 @@ class KebaKeContactConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Release the validation client when the flow is aborted or removed."""
+        if self._client is not None:
+            self.hass.async_create_task(self._client.disconnect())
+            self._client = None
+
     async def async_step_automatic(
         self, data: dict[str, Any]
     ) -> FlowResult:
@@ -197,19 +215,11 @@ class KebaKeContactOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(
                     CONF_RFID,
                     description={"suggested_value": options.get(CONF_RFID, "")},
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    ),
-                ),
+                ): _TEXT_SELECTOR,
                 vol.Optional(
                     CONF_RFID_CLASS,
                     description={"suggested_value": options.get(CONF_RFID_CLASS, "")},
-                ): selector.TextSelector(
-                    selector.TextSelectorConfig(
-                        type=selector.TextSelectorType.TEXT,
-                    ),
-                ),
+                ): _TEXT_SELECTOR,
                 vol.Optional(
                     CONF_VEHICLE_SOC_ENTITY,
                     description={"suggested_value": options.get(CONF_VEHICLE_SOC_ENTITY)},
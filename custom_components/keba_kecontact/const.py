@@ -1,56 +1,58 @@
 """Constants for the Keba KeContact integration."""
 
-DOMAIN = "keba_kecontact"
-
-CONF_IP_ADDRESS = "ip_address"
-CONF_RFID = "rfid"
-CONF_RFID_CLASS = "rfid_class"
-CONF_CHARGER_PRIORITY = "charger_priority"
-
-CONF_COORDINATOR_NAME = "coordinator_name"
-CONF_COORDINATOR_CHARGERS = "coordinator_chargers"
-CONF_COORDINATOR_MAX_CURRENT = "coordinator_max_current"
-CONF_COORDINATOR_STRATEGY = "coordinator_strategy"
-
-COORDINATOR_STRATEGY_OFF = "off"
-COORDINATOR_STRATEGY_EQUAL = "equal"
-COORDINATOR_STRATEGY_SMART = "smart"
-
-CONF_NORDPOOL_ENTITY = "nordpool_entity"
-CONF_VEHICLE_SOC_ENTITY = "vehicle_soc_entity"
-CONF_BATTERY_CAPACITY = "battery_capacity_kwh"
-CONF_DEPARTURE_TIME = "departure_time"
-CONF_TARGET_SOC = "target_soc"
-
-MIN_CHARGING_CURRENT_A = 6
-DEFAULT_BATTERY_CAPACITY_KWH = 60
-DEFAULT_TARGET_SOC = 100
-
-PRIORITY_LOW = "low"
-PRIORITY_NORMAL = "normal"
-PRIORITY_HIGH = "high"
-
-DEFAULT_SCAN_INTERVAL = 10
-
-ATTR_CURRENT_LIMIT = "current_limit"
-ATTR_MAX_CURRENT = "max_current"
-ATTR_SESSION_ENERGY = "session_energy"
-ATTR_TOTAL_ENERGY = "total_energy"
-ATTR_STATE = "state"
-ATTR_PLUG = "plug"
-ATTR_SERIAL = "serial"
-ATTR_PRODUCT = "product"
-ATTR_FIRMWARE = "firmware"
-
-STATE_STARTING = "starting"
-STATE_NOT_READY = "not_ready"
-STATE_READY = "ready"
-STATE_CHARGING = "charging"
-STATE_ERROR = "error"
-STATE_AUTHORIZATION_REJECTED = "authorization_rejected"
-
-PLUG_UNPLUGGED = "unplugged"
-PLUG_PLUGGED_ON_STATION = "plugged_on_station"
-PLUG_PLUGGED_ON_STATION_LOCKED = "plugged_on_station_locked"
-PLUG_PLUGGED_ON_STATION_AND_EV = "plugged_on_station_and_ev"
-PLUG_PLUGGED_ON_STATION_AND_EV_LOCKED = "plugged_on_station_and_ev_locked"
+from typing import Final
+
+DOMAIN: Final = "keba_kecontact"
+
+CONF_IP_ADDRESS: Final = "ip_address"
+CONF_RFID: Final = "rfid"
+CONF_RFID_CLASS: Final = "rfid_class"
+CONF_CHARGER_PRIORITY: Final = "charger_priority"
+
+CONF_COORDINATOR_NAME: Final = "coordinator_name"
+CONF_COORDINATOR_CHARGERS: Final = "coordinator_chargers"
+CONF_COORDINATOR_MAX_CURRENT: Final = "coordinator_max_current"
+CONF_COORDINATOR_STRATEGY: Final = "coordinator_strategy"
+
+COORDINATOR_STRATEGY_OFF: Final = "off"
+COORDINATOR_STRATEGY_EQUAL: Final = "equal"
+COORDINATOR_STRATEGY_SMART: Final = "smart"
+
+CONF_NORDPOOL_ENTITY: Final = "nordpool_entity"
+CONF_VEHICLE_SOC_ENTITY: Final = "vehicle_soc_entity"
+CONF_BATTERY_CAPACITY: Final = "battery_capacity_kwh"
+CONF_DEPARTURE_TIME: Final = "departure_time"
+CONF_TARGET_SOC: Final = "target_soc"
+
+MIN_CHARGING_CURRENT_A: Final = 6
+DEFAULT_BATTERY_CAPACITY_KWH: Final = 60
+DEFAULT_TARGET_SOC: Final = 100
+
+PRIORITY_LOW: Final = "low"
+PRIORITY_NORMAL: Final = "normal"
+PRIORITY_HIGH: Final = "high"
+
+DEFAULT_SCAN_INTERVAL: Final = 10
+
+ATTR_CURRENT_LIMIT: Final = "current_limit"
+ATTR_MAX_CURRENT: Final = "max_current"
+ATTR_SESSION_ENERGY: Final = "session_energy"
+ATTR_TOTAL_ENERGY: Final = "total_energy"
+ATTR_STATE: Final = "state"
+ATTR_PLUG: Final = "plug"
+ATTR_SERIAL: Final = "serial"
+ATTR_PRODUCT: Final = "product"
+ATTR_FIRMWARE: Final = "firmware"
+
+STATE_STARTING: Final = "starting"
+STATE_NOT_READY: Final = "not_ready"
+STATE_READY: Final = "ready"
+STATE_CHARGING: Final = "charging"
+STATE_ERROR: Final = "error"
+STATE_AUTHORIZATION_REJECTED: Final = "authorization_rejected"
+
+PLUG_UNPLUGGED: Final = "unplugged"
+PLUG_PLUGGED_ON_STATION: Final = "plugged_on_station"
+PLUG_PLUGGED_ON_STATION_LOCKED: Final = "plugged_on_station_locked"
+PLUG_PLUGGED_ON_STATION_AND_EV: Final = "plugged_on_station_and_ev"
+PLUG_PLUGGED_ON_STATION_AND_EV_LOCKED: Final = "plugged_on_station_and_ev_locked"
@@ -3,11 +3,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.core import HomeAssistant, Event, callback
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -25,8 +28,42 @@ from .smart_charger import SmartCharger
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=10)
+# Data is pushed on every charger update; the timer only catches reloaded chargers.
+SCAN_INTERVAL = timedelta(seconds=60)
+REBALANCE_DEBOUNCE_SECONDS = 0.5
 MAX_DISPLAY_LENGTH = 23
+MIN_CURRENT_MA = 6000
+MAX_CURRENT_MA = 63000
+
+# Strategies that leave charger currents alone. Any other strategy, even one
+# without an entry in _STRATEGY_APPLY, restores user limits when fewer than
+# two chargers are active.
+_PASSIVE_STRATEGIES = (COORDINATOR_STRATEGY_OFF, COORDINATOR_STRATEGY_SMART)
+
+
+@dataclass(slots=True)
+class ChargerSnapshot:
+    """State of one managed charger as seen by the coordinator."""
+
+    state: int | None
+    power_kw: float = 0.0
+    energy_present_kwh: float = 0.0
+    energy_total_kwh: float = 0.0
+    max_curr: int = 0
+    serial: str | None = None
+    client: Any = None
+    curr_user: int | None = None
+
+
+def _charger_hw_limit_ma(entry_data: dict[str, Any]) -> int:
+    """Return a charger's hardware current limit in mA from its latest report."""
+    coordinator = entry_data.get("coordinator")
+    charger_data = coordinator.data if coordinator else None
+    if charger_data:
+        curr_hw = charger_data.get("curr_hw")
+        if curr_hw is not None:
+            return curr_hw
+    return MAX_CURRENT_MA
 
 
 class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -48,11 +85,18 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=f"{DOMAIN}_coordinator_{name}",
             update_interval=SCAN_INTERVAL,
+            always_update=False,
         )
         self._charger_entry_ids = charger_entry_ids
-        self._max_current = max_current
+        self._max_current_ma = max_current * 1000
         self._strategy = strategy
         self._state_listener = None
+        self._tracked_entity_ids: list[str] = []
+        self._child_listeners: dict[str, tuple[DataUpdateCoordinator, Callable[[], None]]] = {}
+        self._pending_rebalance: asyncio.TimerHandle | None = None
+        self._rebalance_task: asyncio.Task | None = None
+        self._rebalance_lock = asyncio.Lock()
+        self._last_applied: dict[str, tuple[int, str]] = {}
         self._previous_active_count = 0
 
         self._nordpool_entity = nordpool_entity
@@ -60,9 +104,7 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_start(self) -> None:
         """Start the coordinator."""
-        self._state_listener = self.hass.bus.async_listen(
-            EVENT_STATE_CHANGED, self._handle_state_change
-        )
+        self._update_state_listener()
 
         if self._strategy == COORDINATOR_STRATEGY_SMART:
             await self._enable_smart_charging()
@@ -74,6 +116,19 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if self._state_listener:
             self._state_listener()
             self._state_listener = None
+        self._tracked_entity_ids = []
+
+        for _child, remove_listener in self._child_listeners.values():
+            remove_listener()
+        self._child_listeners.clear()
+
+        if self._pending_rebalance:
+            self._pending_rebalance.cancel()
+            self._pending_rebalance = None
+
+        if self._rebalance_task is not None:
+            self._rebalance_task.cancel()
+            self._rebalance_task = None
 
         if self._smart_charger:
             await self._smart_charger.async_stop()
@@ -103,89 +158,182 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._smart_charger = None
             _LOGGER.info("Smart charging disabled")
 
+    @callback
+    def _update_state_listener(self) -> None:
+        """Track charger state sensors only while the strategy rebalances on them."""
+        if self._strategy in _PASSIVE_STRATEGIES:
+            if self._state_listener:
+                self._state_listener()
+                self._state_listener = None
+            self._tracked_entity_ids = []
+            return
+
+        entity_ids = self._state_entity_ids()
+        if self._state_listener is not None:
+            if entity_ids == self._tracked_entity_ids:
+                return
+            self._state_listener()
+
+        self._tracked_entity_ids = entity_ids
+        self._state_listener = async_track_state_change_event(
+            self.hass, entity_ids, self._handle_state_change
+        )
+
+    def _state_entity_ids(self) -> list[str]:
+        """Return the state sensor entity IDs of the managed chargers."""
+        registry = er.async_get(self.hass)
+        entity_ids = []
+        for entry_id in self._charger_entry_ids:
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry_id}_state")
+            if entity_id is None:
+                _LOGGER.debug("Charger entry %s has no state sensor registered, not tracking", entry_id)
+                continue
+            entity_ids.append(entity_id)
+        return entity_ids
+
     @callback
     def _handle_state_change(self, event: Event) -> None:
         """Handle state changes from chargers."""
-        entity_id = event.data.get("entity_id", "")
+        _LOGGER.debug("Charger state changed: %s, scheduling refresh", event.data.get("entity_id"))
+        self._schedule_rebalance()
 
-        if "keba_kecontact" in entity_id and "state" in entity_id:
-            _LOGGER.debug("Charger state changed: %s, scheduling refresh", entity_id)
-            self.hass.async_create_task(self._apply_load_balancing())
+    @callback
+    def _schedule_rebalance(self) -> None:
+        """Schedule load balancing, coalescing bursts of state changes."""
+        if self._pending_rebalance is not None:
+            return
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from all chargers and aggregate."""
-        try:
-            total_power = 0.0
-            total_session_energy = 0.0
-            total_energy = 0.0
-            active_chargers = 0
-            charger_states = {}
+        self._pending_rebalance = self.hass.loop.call_later(
+            REBALANCE_DEBOUNCE_SECONDS, self._run_scheduled_rebalance
+        )
 
-            for entry_id in self._charger_entry_ids:
-                if entry_id not in self.hass.data.get(DOMAIN, {}):
-                    _LOGGER.debug("Charger entry %s not found in hass.data, skipping", entry_id)
-                    continue
+    @callback
+    def _run_scheduled_rebalance(self) -> None:
+        """Start the load balancing pass scheduled by _schedule_rebalance."""
+        self._pending_rebalance = None
+        if self._rebalance_task is not None and not self._rebalance_task.done():
+            # Coalesce with the running pass; retry once it is done.
+            self._schedule_rebalance()
+            return
 
-                entry_data = self.hass.data[DOMAIN][entry_id]
-                if "coordinator" not in entry_data:
-                    _LOGGER.debug("Charger entry %s has no coordinator, skipping", entry_id)
-                    continue
+        self._rebalance_task = self.hass.async_create_task(self._apply_load_balancing())
 
-                coordinator = entry_data["coordinator"]
-                if not coordinator.data:
-                    _LOGGER.debug("Charger entry %s has no data yet, skipping", entry_id)
-                    continue
+    def _charger_entries(self) -> Iterator[tuple[str, dict[str, Any], dict[str, Any]]]:
+        """Yield entry ID, hass.data entry and latest data of each loaded charger."""
+        domain_data = self.hass.data.get(DOMAIN, {})
+        for entry_id in self._charger_entry_ids:
+            entry_data = domain_data.get(entry_id)
+            if entry_data is None:
+                _LOGGER.debug("Charger entry %s not found in hass.data, skipping", entry_id)
+                continue
 
-                charger_data = coordinator.data
+            if "coordinator" not in entry_data:
+                _LOGGER.debug("Charger entry %s has no coordinator, skipping", entry_id)
+                continue
 
-                charger_states[entry_id] = {
-                    "state": charger_data.get("state"),
-                    "power_kw": charger_data.get("power_kw", 0),
-                    "max_curr": charger_data.get("max_curr", 0),
-                    "serial": charger_data.get("serial"),
-                }
+            charger_data = entry_data["coordinator"].data
+            if not charger_data:
+                _LOGGER.debug("Charger entry %s has no data yet, skipping", entry_id)
+                continue
 
-                power = charger_data.get("power_kw", 0) or 0
-                session_energy = charger_data.get("energy_present_kwh", 0) or 0
-                total_energy_charger = charger_data.get("energy_total_kwh", 0) or 0
-                state = charger_data.get("state")
+            yield entry_id, entry_data, charger_data
 
-                total_power += power
-                total_session_energy += session_energy
-                total_energy += total_energy_charger
+    @callback
+    def _sync_child_listeners(self) -> None:
+        """Listen to each charger's coordinator, following it across reloads."""
+        domain_data = self.hass.data.get(DOMAIN, {})
+        changed = False
+        for entry_id in self._charger_entry_ids:
+            child = domain_data.get(entry_id, {}).get("coordinator")
+            listener = self._child_listeners.get(entry_id)
+            if listener is not None:
+                if listener[0] is child:
+                    continue
+                listener[1]()
+                del self._child_listeners[entry_id]
+                changed = True
+
+            if child is not None:
+                self._child_listeners[entry_id] = (
+                    child,
+                    child.async_add_listener(self._handle_child_update),
+                )
+                changed = True
 
-                if state == 3:
-                    active_chargers += 1
+        # Chargers that load after the coordinator register their state
+        # sensor later, so look the sensors up again until all are tracked.
+        if changed or len(self._tracked_entity_ids) < len(self._charger_entry_ids):
+            self._update_state_listener()
 
-            distribution = self._calculate_distribution(charger_states)
-            is_balancing = self._is_load_balancing_active(active_chargers)
+    @callback
+    def _handle_child_update(self) -> None:
+        """Re-aggregate as soon as any charger has new data."""
+        try:
+            data = self._aggregate()
+        except Exception as err:
+            _LOGGER.error("Failed to update charging coordinator data: %s", err, exc_info=True)
+            return
 
-            if active_chargers != self._previous_active_count:
-                _LOGGER.info(
-                    "Active chargers changed from %d to %d, applying load balancing",
-                    self._previous_active_count,
-                    active_chargers
-                )
-                self._previous_active_count = active_chargers
-                self.hass.async_create_task(self._apply_load_balancing())
-
-            return {
-                "total_power": total_power,
-                "total_session_energy": total_session_energy,
-                "total_energy": total_energy,
-                "active_chargers": active_chargers,
-                "charger_states": charger_states,
-                "distribution": distribution,
-                "max_current": self._max_current,
-                "strategy": self._strategy,
-                "is_load_balancing_active": is_balancing,
-            }
+        # async_set_updated_data always notifies, so apply always_update=False here too.
+        if data == self.data:
+            return
+        self.async_set_updated_data(data)
 
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from all chargers and aggregate."""
+        try:
+            return self._aggregate()
         except Exception as err:
             _LOGGER.error("Failed to update charging coordinator data: %s", err, exc_info=True)
             raise UpdateFailed(f"Error updating coordinator: {err}") from err
 
-    def _calculate_distribution(self, charger_states: dict[str, Any]) -> str:
+    def _aggregate(self) -> dict[str, Any]:
+        """Aggregate the latest data of all managed chargers."""
+        self._sync_child_listeners()
+
+        charger_states = {
+            entry_id: ChargerSnapshot(
+                state=charger_data.get("state"),
+                power_kw=charger_data.get("power_kw") or 0.0,
+                energy_present_kwh=charger_data.get("energy_present_kwh") or 0.0,
+                energy_total_kwh=charger_data.get("energy_total_kwh") or 0.0,
+                max_curr=charger_data.get("max_curr", 0),
+                serial=charger_data.get("serial"),
+            )
+            for entry_id, _entry_data, charger_data in self._charger_entries()
+        }
+        snapshots = charger_states.values()
+
+        total_power = sum((snapshot.power_kw for snapshot in snapshots), 0.0)
+        total_session_energy = sum((snapshot.energy_present_kwh for snapshot in snapshots), 0.0)
+        total_energy = sum((snapshot.energy_total_kwh for snapshot in snapshots), 0.0)
+        active_chargers = sum(1 for snapshot in snapshots if snapshot.state == 3)
+
+        distribution = self._calculate_distribution(active_chargers)
+        is_balancing = self._is_load_balancing_active(active_chargers)
+
+        if active_chargers != self._previous_active_count:
+            _LOGGER.info(
+                "Active chargers changed from %d to %d, applying load balancing",
+                self._previous_active_count,
+                active_chargers
+            )
+            self._previous_active_count = active_chargers
+            self._schedule_rebalance()
+
+        return {
+            "total_power": total_power,
+            "total_session_energy": total_session_energy,
+            "total_energy": total_energy,
+            "active_chargers": active_chargers,
+            "charger_states": charger_states,
+            "distribution": distribution,
+            "max_current": self._max_current,
+            "strategy": self._strategy,
+            "is_load_balancing_active": is_balancing,
+        }
+
+    def _calculate_distribution(self, num_active: int) -> str:
         """Calculate current distribution description."""
         if self._strategy == COORDINATOR_STRATEGY_OFF:
             return "Off - No load balancing"
@@ -196,13 +344,6 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 return f"Smart - {num_plans} active plan(s)"
             return "Smart - Waiting for cars"
 
-        active_chargers = [
-            entry_id for entry_id, state in charger_states.items()
-            if state.get("state") == 3
-        ]
-
-        num_active = len(active_chargers)
-
         if num_active == 0:
             return f"{self._max_current}A available"
 
@@ -224,40 +365,34 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _apply_load_balancing(self) -> None:
         """Apply load balancing based on current strategy."""
-        if self._strategy == COORDINATOR_STRATEGY_OFF:
+        # Scheduled passes and setting changes share this lock so that two
+        # passes never send interleaved allocations to the chargers.
+        async with self._rebalance_lock:
+            await self._apply_load_balancing_locked()
+
+    async def _apply_load_balancing_locked(self) -> None:
+        """Run one load balancing pass; the caller holds _rebalance_lock."""
+        if self._strategy in _PASSIVE_STRATEGIES:
             return
 
-        if self._strategy == COORDINATOR_STRATEGY_SMART:
-            return
+        apply_strategy = self._STRATEGY_APPLY.get(self._strategy)
 
         try:
             charger_states = {}
-            for entry_id in self._charger_entry_ids:
-                if entry_id not in self.hass.data.get(DOMAIN, {}):
-                    _LOGGER.debug("Charger entry %s not found during load balancing, skipping", entry_id)
+            active_chargers = {}
+            for entry_id, entry_data, charger_data in self._charger_entries():
+                if "client" not in entry_data:
+                    _LOGGER.debug("Charger entry %s has no client, skipping", entry_id)
                     continue
 
-                entry_data = self.hass.data[DOMAIN][entry_id]
-                if "coordinator" not in entry_data or "client" not in entry_data:
-                    _LOGGER.debug("Charger entry %s missing coordinator or client, skipping", entry_id)
-                    continue
-
-                coordinator = entry_data["coordinator"]
-                if not coordinator.data:
-                    _LOGGER.debug("Charger entry %s has no data during load balancing, skipping", entry_id)
-                    continue
-
-                charger_data = coordinator.data
-                charger_states[entry_id] = {
-                    "state": charger_data.get("state"),
-                    "client": entry_data["client"],
-                }
-
-            active_chargers = {
-                entry_id: data
-                for entry_id, data in charger_states.items()
-                if data.get("state") == 3
-            }
+                state = charger_data.get("state")
+                charger_states[entry_id] = ChargerSnapshot(
+                    state=state,
+                    client=entry_data["client"],
+                    curr_user=charger_data.get("curr_user"),
+                )
+                if state == 3:
+                    active_chargers[entry_id] = charger_states[entry_id]
 
             num_active = len(active_chargers)
 
@@ -265,19 +400,21 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 await self._restore_all_chargers_to_user_limits(charger_states)
             elif num_active == 1:
                 await self._restore_all_chargers_to_user_limits(charger_states)
-            elif self._strategy == COORDINATOR_STRATEGY_EQUAL:
-                await self._apply_equal_strategy(active_chargers)
+            elif apply_strategy is not None:
+                await apply_strategy(self, active_chargers)
 
             await self.async_request_refresh()
 
         except Exception as err:
             _LOGGER.error("Failed to apply load balancing: %s", err, exc_info=True)
 
-    async def _restore_all_chargers_to_user_limits(self, charger_states: dict[str, Any]) -> None:
+    async def _restore_all_chargers_to_user_limits(self, charger_states: dict[str, ChargerSnapshot]) -> None:
         """Restore all chargers to their user-configured current limits."""
+        allocations = []
+        domain_data = self.hass.data[DOMAIN]
         for entry_id, data in charger_states.items():
-            client = data["client"]
-            entry_data = self.hass.data[DOMAIN].get(entry_id, {})
+            client = data.client
+            entry_data = domain_data.get(entry_id, {})
             config_entry = entry_data.get("config_entry")
 
             if not config_entry:
@@ -290,70 +427,58 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 continue
 
             user_limit_ma = int(user_limit * 1000)
+            actual_current_ma = min(user_limit_ma, _charger_hw_limit_ma(entry_data))
+            allocations.append((entry_id, client, actual_current_ma, f"User {actual_current_ma // 1000}A"))
 
-            coordinator = entry_data.get("coordinator")
-            charger_hw_limit_ma = 63000
-            if coordinator and coordinator.data:
-                curr_hw = coordinator.data.get("curr_hw")
-                if curr_hw is not None:
-                    charger_hw_limit_ma = curr_hw
-
-            actual_current_ma = min(user_limit_ma, charger_hw_limit_ma)
-
-            try:
-                await client.set_current(actual_current_ma)
-                _LOGGER.debug(
-                    "Restored charger %s to user limit %d mA",
-                    client.ip_address,
-                    actual_current_ma
-                )
+        allocations = self._changed_allocations(allocations, charger_states)
 
-                message = f"User {int(actual_current_ma / 1000)}A"
-                await self._send_display_message(client, message)
+        results = await asyncio.gather(
+            *(self._dispatch(client, current_ma, message) for _entry_id, client, current_ma, message in allocations),
+            return_exceptions=True,
+        )
 
-            except Exception as err:
+        for (entry_id, client, current_ma, message), result in zip(allocations, results):
+            if isinstance(result, Exception):
                 _LOGGER.error(
                     "Failed to restore charger %s to user limit: %s",
                     client.ip_address,
-                    err
+                    result
+                )
+            else:
+                self._last_applied[entry_id] = (current_ma, message)
+                _LOGGER.debug(
+                    "Restored charger %s to user limit %d mA",
+                    client.ip_address,
+                    current_ma
                 )
 
-    async def _apply_equal_strategy(self, active_chargers: dict[str, Any]) -> None:
+    async def _apply_equal_strategy(self, active_chargers: dict[str, ChargerSnapshot]) -> None:
         """Apply equal distribution strategy."""
-        min_current_ma = 6000
-        available_current_ma = self._max_current * 1000
+        available_current_ma = self._max_current_ma
         num_chargers = len(active_chargers)
 
-        min_total_required = min_current_ma * num_chargers
+        min_total_required = MIN_CURRENT_MA * num_chargers
 
         if available_current_ma < min_total_required:
             _LOGGER.warning(
-                "Insufficient current: %d mA available, but %d chargers need minimum %d mA total (6A each). "
+                "Insufficient current: %d mA available, but %d chargers need minimum %d mA total (%d mA each). "
                 "Load balancing cannot proceed safely.",
                 available_current_ma,
                 num_chargers,
-                min_total_required
+                min_total_required,
+                MIN_CURRENT_MA
             )
             return
 
-        per_charger_ma = int(available_current_ma / num_chargers)
-        per_charger_ma = max(min_current_ma, per_charger_ma)
-
-        per_charger_a = per_charger_ma / 1000
+        per_charger_ma = available_current_ma // num_chargers
+        per_charger_ma = max(MIN_CURRENT_MA, per_charger_ma)
 
+        allocations = []
+        domain_data = self.hass.data[DOMAIN]
         for entry_id, data in active_chargers.items():
-            client = data["client"]
-
-            entry_data = self.hass.data[DOMAIN].get(entry_id, {})
-            coordinator = entry_data.get("coordinator")
-
-            charger_hw_limit_ma = 63000
-
-            if coordinator and coordinator.data:
-                curr_hw = coordinator.data.get("curr_hw")
-                if curr_hw is not None:
-                    charger_hw_limit_ma = curr_hw
+            client = data.client
 
+            charger_hw_limit_ma = _charger_hw_limit_ma(domain_data.get(entry_id, {}))
             actual_current_ma = min(per_charger_ma, charger_hw_limit_ma)
 
             limit_reason = "LoadBal"
@@ -369,34 +494,73 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 limit_reason
             )
 
-            try:
-                await client.set_current(actual_current_ma)
-                _LOGGER.debug(
-                    "Set charger %s to %d mA (equal distribution)",
-                    client.ip_address,
-                    actual_current_ma
-                )
+            allocations.append((entry_id, client, actual_current_ma, f"{limit_reason} {actual_current_ma // 1000}A"))
+
+        allocations = self._changed_allocations(allocations, active_chargers)
 
-                message = f"{limit_reason} {int(actual_current_ma / 1000)}A"
-                await self._send_display_message(client, message)
+        results = await asyncio.gather(
+            *(self._dispatch(client, current_ma, message) for _entry_id, client, current_ma, message in allocations),
+            return_exceptions=True,
+        )
 
-            except Exception as err:
+        for (entry_id, client, current_ma, message), result in zip(allocations, results):
+            if isinstance(result, Exception):
                 _LOGGER.error(
                     "Failed to set current for charger %s: %s",
                     client.ip_address,
-                    err
+                    result
                 )
+            else:
+                self._last_applied[entry_id] = (current_ma, message)
+                _LOGGER.debug(
+                    "Set charger %s to %d mA (equal distribution)",
+                    client.ip_address,
+                    current_ma
+                )
+
+    # Strategies that actively redistribute current between active chargers.
+    _STRATEGY_APPLY = {
+        COORDINATOR_STRATEGY_EQUAL: _apply_equal_strategy,
+    }
 
+    def _changed_allocations(
+        self,
+        allocations: list[tuple[str, Any, int, str]],
+        chargers: dict[str, ChargerSnapshot],
+    ) -> list[tuple[str, Any, int, str]]:
+        """Drop allocations already applied to and still reported by each charger.
+
+        The charger's current can change behind the coordinator's back (the
+        per-charger current limit, a reboot, failsafe or a lost command), so
+        an allocation is only skipped while the charger still reports it.
+        """
+        allocated_ids = {entry_id for entry_id, *_ in allocations}
+        for entry_id in self._last_applied.keys() - allocated_ids:
+            del self._last_applied[entry_id]
+
+        return [
+            allocation for allocation in allocations
+            if self._last_applied.get(allocation[0]) != (allocation[2], allocation[3])
+            or chargers[allocation[0]].curr_user != allocation[2]
+        ]
+
+    async def _dispatch(self, client, current_ma: int, message: str) -> None:
+        """Set a charger's current and show the reason on its display."""
+        await client.set_current(current_ma)
+        await self._send_display_message(client, message)
 
     async def set_max_current(self, current: int) -> None:
         """Update maximum available current."""
-        self._max_current = current
+        self._max_current_ma = current * 1000
+        self._last_applied.clear()
         await self._apply_load_balancing()
 
     async def set_strategy(self, strategy: str) -> None:
         """Update load balancing strategy."""
         old_strategy = self._strategy
         self._strategy = strategy
+        self._last_applied.clear()
+        self._update_state_listener()
 
         if old_strategy == COORDINATOR_STRATEGY_SMART and strategy != COORDINATOR_STRATEGY_SMART:
             await self._disable_smart_charging()
@@ -409,8 +573,7 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _send_display_message(self, client, message: str) -> None:
         """Send a message to charger display, truncating if necessary."""
-        if len(message) > MAX_DISPLAY_LENGTH:
-            message = message[:MAX_DISPLAY_LENGTH]
+        message = message[:MAX_DISPLAY_LENGTH]
 
         try:
             await client.display_text(message)
@@ -423,6 +586,15 @@ class KebaChargingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the list of managed charger entry IDs."""
         return self._charger_entry_ids
 
+    @property
+    def _max_current(self) -> int:
+        """Maximum available current in amps, derived from _max_current_ma."""
+        return self._max_current_ma // 1000
+
+    @_max_current.setter
+    def _max_current(self, current: int) -> None:
+        self._max_current_ma = current * 1000
+
     @property
     def max_current(self) -> int:
         """Return the maximum current setting."""
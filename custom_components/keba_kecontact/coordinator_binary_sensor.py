@@ -8,7 +8,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -59,11 +59,13 @@ class CoordinatorLoadBalancingActiveSensor(
         self._attr_unique_id = f"{entry.entry_id}_load_balancing_active"
         self._attr_has_entity_name = True
         self._attr_name = "Load Balancing Active"
+        self._attr_is_on = bool((coordinator.data or {}).get("is_load_balancing_active"))
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if load balancing is active."""
-        return self.coordinator.data.get("is_load_balancing_active", False)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the cached state from the coordinator."""
+        self._attr_is_on = bool(self.coordinator.data.get("is_load_balancing_active"))
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
@@ -1,21 +1,26 @@
 """Support for Keba Charging Coordinator number entities."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfElectricCurrent
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, UnitOfElectricCurrent
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import KebaChargingCoordinator
-from .const import DOMAIN
+from .const import CONF_COORDINATOR_MAX_CURRENT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options updates reload the coordinator entry, so slider drags are only
+# persisted once the value has settled.
+PERSIST_DEBOUNCE_SECONDS = 1.0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,29 +65,84 @@ class CoordinatorMaxCurrentNumber(NumberEntity):
         self._attr_unique_id = f"{entry.entry_id}_max_current"
         self._attr_has_entity_name = True
         self._attr_name = "Max Current"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        return float(self._coordinator.max_current)
+        self._attr_native_value = float(coordinator.max_current)
+        self._persist_handle: asyncio.TimerHandle | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Follow max current changes made outside this entity."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Write a pending options change before the entity goes away."""
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        self._flush_persist()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _async_handle_stop(self, _event: Event) -> None:
+        """Write a pending options change before Home Assistant shuts down."""
+        self._unsub_stop = None
+        self._flush_persist()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached value when the coordinator's limit changed."""
+        value = float(self._coordinator.max_current)
+        if value != self._attr_native_value:
+            self._attr_native_value = value
+            self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
         _LOGGER.debug("Setting coordinator max current to %.1f A", value)
         try:
             await self._coordinator.set_max_current(int(value))
+            self._attr_native_value = value
+            self.async_write_ha_state()
+            self._schedule_persist()
 
-            from .const import CONF_COORDINATOR_MAX_CURRENT
-            new_options = {**self._entry.options, CONF_COORDINATOR_MAX_CURRENT: int(value)}
-            self.hass.config_entries.async_update_entry(
-                self._entry, options=new_options
-            )
-
-            _LOGGER.info("Set coordinator max current to %.1f A and persisted to config", value)
+            _LOGGER.info("Set coordinator max current to %.1f A", value)
         except Exception as err:
             _LOGGER.error("Failed to set coordinator max current to %.1f A: %s", value, err)
             raise
 
+    @callback
+    def _schedule_persist(self) -> None:
+        """Persist the max current to the entry options once it settles."""
+        if self._persist_handle is not None:
+            self._persist_handle.cancel()
+        self._persist_handle = self.hass.loop.call_later(
+            PERSIST_DEBOUNCE_SECONDS, self._persist
+        )
+
+    @callback
+    def _flush_persist(self) -> None:
+        """Run a scheduled persist now instead of when its timer fires."""
+        if self._persist_handle is None:
+            return
+        self._persist_handle.cancel()
+        self._persist()
+
+    @callback
+    def _persist(self) -> None:
+        """Write the current max current to the config entry options."""
+        self._persist_handle = None
+        value = self._coordinator.max_current
+        if self._entry.options.get(CONF_COORDINATOR_MAX_CURRENT) == value:
+            return
+        new_options = {**self._entry.options, CONF_COORDINATOR_MAX_CURRENT: value}
+        self.hass.config_entries.async_update_entry(self._entry, options=new_options)
+        _LOGGER.info("Persisted coordinator max current %d A to config", value)
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -14,7 +14,7 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -58,6 +58,9 @@ async def async_setup_entry(
 class CoordinatorBaseSensor(CoordinatorEntity[KebaChargingCoordinator], SensorEntity):
     """Base class for Keba Charging Coordinator sensors."""
 
+    _key: str
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: KebaChargingCoordinator,
@@ -68,127 +71,60 @@ class CoordinatorBaseSensor(CoordinatorEntity[KebaChargingCoordinator], SensorEn
         super().__init__(coordinator)
         self._attr_device_info = device_info
         self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_{self._key}"
+        self._attr_native_value = (coordinator.data or {}).get(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the cached value from the coordinator."""
+        self._attr_native_value = self.coordinator.data.get(self._key)
+        super()._handle_coordinator_update()
 
 
 class CoordinatorTotalPowerSensor(CoordinatorBaseSensor):
     """Sensor for total power consumption across all chargers."""
 
+    _key = "total_power"
+    _attr_name = "Total Power"
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
     _attr_suggested_display_precision = 2
 
-    def __init__(
-        self,
-        coordinator: KebaChargingCoordinator,
-        entry: ConfigEntry,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, device_info)
-        self._attr_unique_id = f"{entry.entry_id}_total_power"
-        self._attr_has_entity_name = True
-        self._attr_name = "Total Power"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("total_power")
-
 
 class CoordinatorTotalSessionEnergySensor(CoordinatorBaseSensor):
     """Sensor for total session energy across all chargers."""
 
+    _key = "total_session_energy"
+    _attr_name = "Total Session Energy"
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_suggested_display_precision = 2
 
-    def __init__(
-        self,
-        coordinator: KebaChargingCoordinator,
-        entry: ConfigEntry,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, device_info)
-        self._attr_unique_id = f"{entry.entry_id}_total_session_energy"
-        self._attr_has_entity_name = True
-        self._attr_name = "Total Session Energy"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("total_session_energy")
-
 
 class CoordinatorTotalEnergySensor(CoordinatorBaseSensor):
     """Sensor for total energy across all chargers."""
 
+    _key = "total_energy"
+    _attr_name = "Total Energy"
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_suggested_display_precision = 2
 
-    def __init__(
-        self,
-        coordinator: KebaChargingCoordinator,
-        entry: ConfigEntry,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, device_info)
-        self._attr_unique_id = f"{entry.entry_id}_total_energy"
-        self._attr_has_entity_name = True
-        self._attr_name = "Total Energy"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("total_energy")
-
 
 class CoordinatorActiveChargersSensor(CoordinatorBaseSensor):
     """Sensor for number of active chargers."""
 
+    _key = "active_chargers"
+    _attr_name = "Active Chargers"
     _attr_icon = "mdi:ev-station"
 
-    def __init__(
-        self,
-        coordinator: KebaChargingCoordinator,
-        entry: ConfigEntry,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, device_info)
-        self._attr_unique_id = f"{entry.entry_id}_active_chargers"
-        self._attr_has_entity_name = True
-        self._attr_name = "Active Chargers"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("active_chargers")
-
 
 class CoordinatorDistributionSensor(CoordinatorBaseSensor):
     """Sensor for current distribution description."""
 
+    _key = "distribution"
+    _attr_name = "Current Distribution"
     _attr_icon = "mdi:chart-timeline-variant"
-
-    def __init__(
-        self,
-        coordinator: KebaChargingCoordinator,
-        entry: ConfigEntry,
-        device_info: DeviceInfo,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, device_info)
-        self._attr_unique_id = f"{entry.entry_id}_distribution"
-        self._attr_has_entity_name = True
-        self._attr_name = "Current Distribution"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("distribution")
@@ -2,8 +2,9 @@
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any
-from .udp_handler import KebaUdpHandler, UdpMessage
+from typing import Optional, Dict, Any, Tuple
+from .manager import KebaUdpManager
+from .udp_handler import KebaUdpHandler, UdpMessage, encode_message
 from .protocol import (
     KebaCommand,
     KebaResponse,
@@ -15,6 +16,34 @@ from .protocol import (
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 2.0
+RETRANSMIT_INTERVAL = 0.5
+
+_REPORT_PREFIX = "report "
+
+# Commands that are safe to repeat; anything else (start, stop, unlock,
+# display, ...) is sent once so a duplicate can never act twice.
+_RETRANSMIT_PREFIXES = (_REPORT_PREFIX, "curr ")
+
+# Fixed commands are encoded once; templated ones contain a "%" placeholder.
+_ENCODED_COMMANDS: Dict[KebaCommand, bytes] = {
+    command: encode_message(command.value)
+    for command in KebaCommand
+    if "%" not in command.value
+}
+
+
+def _report_id(command: str) -> Optional[str]:
+    """Return the ID a report response will carry, or None for other commands."""
+    if command.startswith(_REPORT_PREFIX):
+        return command[len(_REPORT_PREFIX):]
+    return None
+
+
+async def _none() -> None:
+    """Placeholder awaitable for a report that is not requested."""
+    return None
+
 
 class KebaClient:
     """Client for communicating with a single Keba KeContact charger.
@@ -33,6 +62,20 @@ class KebaClient:
         await client.connect()
     """
 
+    __slots__ = (
+        "_ip_address",
+        "_use_global_handler",
+        "_given_handler",
+        "_udp_handler",
+        "_owns_handler",
+        "_counted_by_manager",
+        "_pending",
+        "_command_locks",
+        "_connected",
+        "_report1_cache",
+        "_manager",
+    )
+
     def __init__(
         self,
         ip_address: str,
@@ -43,24 +86,24 @@ class KebaClient:
 
         Args:
             ip_address: IP address of the Keba charger
-            udp_handler: Shared UDP handler, or None to create a new one
+            udp_handler: Shared UDP handler, or None to use the global manager's
+                handler if it is running and create a new one otherwise
             use_global_handler: If True, use the global manager's handler (for Home Assistant)
+
+        The handler is resolved in connect(), so the global manager only has
+        to be started before the client connects.
         """
         self._ip_address = ip_address
         self._use_global_handler = use_global_handler
+        self._given_handler = udp_handler
+        self._udp_handler: Optional[KebaUdpHandler] = None
         self._owns_handler = False
-        self._response_queue: asyncio.Queue[KebaResponse] = asyncio.Queue()
+        self._counted_by_manager = False
+        self._pending: Dict[Optional[str], asyncio.Future[KebaResponse]] = {}
+        self._command_locks: Dict[Optional[str], asyncio.Lock] = {}
         self._connected = False
-
-        if use_global_handler:
-            from .manager import KebaUdpManager
-            manager = KebaUdpManager.get_instance()
-            self._udp_handler = manager.get_handler()
-        elif udp_handler is not None:
-            self._udp_handler = udp_handler
-        else:
-            self._udp_handler = KebaUdpHandler()
-            self._owns_handler = True
+        self._report1_cache: Optional[Report1] = None
+        self._manager = KebaUdpManager.get_instance()
 
     @property
     def ip_address(self) -> str:
@@ -72,42 +115,70 @@ class KebaClient:
         if self._connected:
             return
 
-        if self._owns_handler:
-            await self._udp_handler.start()
-
-        if self._use_global_handler:
-            from .manager import KebaUdpManager
-            manager = KebaUdpManager.get_instance()
-            await manager.register_client()
+        manager = self._manager
+        if self._given_handler is not None and not self._use_global_handler:
+            self._udp_handler = self._given_handler
+        elif self._use_global_handler or manager.is_started:
+            # Port 7090 is already bound by the shared socket; a second
+            # handler could not bind it, so multiplex over the shared one.
+            self._udp_handler = manager.get_handler()
+            # Count every client on the shared handler so stopping the
+            # manager cannot close the socket underneath it.
+            manager.register_client()
+            self._counted_by_manager = True
+        else:
+            handler = KebaUdpHandler()
+            await handler.start()
+            self._udp_handler = handler
+            self._owns_handler = True
 
         self._udp_handler.register_callback(self._ip_address, self._on_message)
         self._connected = True
-        _LOGGER.info(f"Connected to Keba charger at {self._ip_address}")
+        _LOGGER.info("Connected to Keba charger at %s", self._ip_address)
 
     async def disconnect(self):
         """Disconnect from the charger."""
         if not self._connected:
             return
 
-        self._udp_handler.unregister_callback(self._ip_address)
+        # Remove only this client's callback; another client may be talking
+        # to the same charger over the shared handler.
+        self._udp_handler.unregister_callback(self._ip_address, self._on_message)
 
-        if self._use_global_handler:
-            from .manager import KebaUdpManager
-            manager = KebaUdpManager.get_instance()
-            await manager.unregister_client()
+        if self._counted_by_manager:
+            self._manager.unregister_client()
+            self._counted_by_manager = False
 
         if self._owns_handler:
             await self._udp_handler.stop()
+            self._owns_handler = False
 
+        self._udp_handler = None
         self._connected = False
-        _LOGGER.info(f"Disconnected from Keba charger at {self._ip_address}")
+        self._report1_cache = None
+        _LOGGER.info("Disconnected from Keba charger at %s", self._ip_address)
 
-    async def send_command(self, command: str, timeout: float = 2.0) -> KebaResponse:
+    async def send_command(
+        self,
+        command: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        retransmit_interval: float = RETRANSMIT_INTERVAL,
+        retransmit: Optional[bool] = None,
+    ) -> KebaResponse:
         """Send a command and wait for response.
 
+        UDP datagrams can be lost in either direction, so idempotent
+        commands are resent every retransmit_interval seconds until a
+        response arrives or the overall timeout expires. Report responses carry the report
+        number as "ID", so different reports can be in flight at once; other
+        commands are acknowledged without an id and are sent one at a time.
+
         Args:
             command: Command string to send
             timeout: Timeout in seconds
+            retransmit_interval: Seconds to wait for a response before resending
+            retransmit: Whether the command may be resent; by default only
+                report and curr commands are
 
         Returns:
             Parsed response from the charger
@@ -119,26 +190,53 @@ class KebaClient:
         if not self._connected:
             raise RuntimeError("Client is not connected")
 
-        while not self._response_queue.empty():
-            self._response_queue.get_nowait()
+        if retransmit is None:
+            retransmit = command.startswith(_RETRANSMIT_PREFIXES)
+        if not retransmit:
+            retransmit_interval = timeout
+
+        tag = _report_id(command)
+        payload = _ENCODED_COMMANDS.get(command) or encode_message(command)
+        lock = self._command_locks.get(tag)
+        if lock is None:
+            lock = self._command_locks[tag] = asyncio.Lock()
+
+        async with lock:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            self._pending[tag] = response = loop.create_future()
+
+            try:
+                while True:
+                    await self._udp_handler.send_message(self._ip_address, payload)
+
+                    remaining = deadline - loop.time()
+                    try:
+                        return await asyncio.wait_for(
+                            asyncio.shield(response),
+                            timeout=min(retransmit_interval, remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        if loop.time() >= deadline:
+                            raise TimeoutError(f"No response received from {self._ip_address} within {timeout}s")
+                        _LOGGER.debug("No response from %s yet, resending: %s", self._ip_address, command)
+            finally:
+                del self._pending[tag]
 
-        await self._udp_handler.send_message(self._ip_address, command)
+    async def get_report_1(self) -> Report1:
+        """Get report 1 - Product information.
 
-        try:
-            response = await asyncio.wait_for(
-                self._response_queue.get(),
-                timeout=timeout
-            )
-            return response
-        except asyncio.TimeoutError:
-            raise TimeoutError(f"No response received from {self._ip_address} within {timeout}s")
+        Product information does not change while connected, so the first
+        report is cached until disconnect().
+        """
+        if self._report1_cache is not None:
+            return self._report1_cache
 
-    async def get_report_1(self) -> Report1:
-        """Get report 1 - Product information."""
         response = await self.send_command(KebaCommand.REPORT_1)
         if not response.is_json or not response.parsed_data:
             raise ValueError(f"Invalid response for report 1: {response.raw_data}")
-        return Report1(response.parsed_data)
+        self._report1_cache = Report1(response.parsed_data)
+        return self._report1_cache
 
     async def get_report_2(self) -> Report2:
         """Get report 2 - Current state."""
@@ -161,6 +259,35 @@ class KebaClient:
             raise ValueError(f"Invalid response for report 100: {response.raw_data}")
         return Report100(response.parsed_data)
 
+    async def get_all_reports(
+        self,
+        include_report_100: bool = True,
+    ) -> Tuple[Report1, Report2, Report3, Optional[Report100]]:
+        """Get reports 1, 2, 3 and 100 with all requests in flight at once.
+
+        Report 100 is not answered by every firmware, so a failure to fetch
+        it is logged and returned as None instead of raised.
+
+        Args:
+            include_report_100: If False, report 100 is not requested and
+                None is returned in its place
+        """
+        report1, report2, report3, report100 = await asyncio.gather(
+            self.get_report_1(),
+            self.get_report_2(),
+            self.get_report_3(),
+            self.get_optional_report_100() if include_report_100 else _none(),
+        )
+        return report1, report2, report3, report100
+
+    async def get_optional_report_100(self) -> Optional[Report100]:
+        """Get report 100, returning None if the charger does not answer it."""
+        try:
+            return await self.get_report_100()
+        except Exception as err:
+            _LOGGER.debug("Could not fetch report 100 (session info): %s", err)
+            return None
+
     async def enable(self):
         """Enable the charging station."""
         await self.send_command(KebaCommand.ENABLE)
@@ -175,7 +302,7 @@ class KebaClient:
         Args:
             milliamps: Current limit in milliamps (mA)
         """
-        command = KebaCommand.CURR.replace("{value}", str(milliamps))
+        command = KebaCommand.CURR % milliamps
         await self.send_command(command)
 
     async def set_energy(self, energy: int):
@@ -184,7 +311,7 @@ class KebaClient:
         Args:
             energy: Energy limit in 0.1 Wh units
         """
-        command = KebaCommand.SETENERGY.replace("{energy}", str(energy))
+        command = KebaCommand.SETENERGY % energy
         await self.send_command(command)
 
     async def set_output(self, output: int):
@@ -193,7 +320,7 @@ class KebaClient:
         Args:
             output: Output value
         """
-        command = KebaCommand.OUTPUT.replace("{output}", str(output))
+        command = KebaCommand.OUTPUT % output
         await self.send_command(command)
 
     async def start_charging(self):
@@ -210,7 +337,7 @@ class KebaClient:
         Args:
             text: Text to display
         """
-        command = KebaCommand.DISPLAY_TEXT.replace("{text}", text)
+        command = KebaCommand.DISPLAY_TEXT % text
         await self.send_command(command)
 
     async def unlock_socket(self):
@@ -226,8 +353,18 @@ class KebaClient:
         Args:
             message: Received UDP message
         """
-        response = KebaResponse.from_raw(message.data)
-        self._response_queue.put_nowait(response)
+        if not self._pending:
+            _LOGGER.debug("Ignoring unsolicited message from %s", self._ip_address)
+            return
+
+        response = KebaResponse.from_raw(message.raw_bytes)
+        report_id = response.get("ID")
+        pending = self._pending.get(None if report_id is None else str(report_id))
+        if pending is None or pending.done():
+            _LOGGER.debug("Ignoring unsolicited message from %s", self._ip_address)
+            return
+
+        pending.set_result(response)
 
     async def __aenter__(self):
         """Async context manager entry."""
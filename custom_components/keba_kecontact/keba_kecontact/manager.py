@@ -34,6 +34,8 @@ class KebaUdpManager:
         await client2.connect()  # Uses same shared handler
     """
 
+    __slots__ = ("_handler", "_client_count", "_started", "_poll_lock")
+
     _instance: Optional['KebaUdpManager'] = None
     _lock = asyncio.Lock()
 
@@ -77,10 +79,11 @@ class KebaUdpManager:
                 _LOGGER.debug("UDP manager already started")
                 return
 
-            if self._handler is None:
-                self._handler = KebaUdpHandler()
-
-            await self._handler.start()
+            # Publish the handler only once it is bound, so get_handler()
+            # never returns one that is still starting.
+            handler = KebaUdpHandler()
+            await handler.start()
+            self._handler = handler
             self._started = True
             _LOGGER.info("Global Keba UDP manager started")
 
@@ -96,14 +99,18 @@ class KebaUdpManager:
 
             if self._client_count > 0:
                 _LOGGER.warning(
-                    f"Cannot stop UDP manager, {self._client_count} clients still connected"
+                    "Cannot stop UDP manager, %d clients still connected",
+                    self._client_count,
                 )
                 return
 
-            if self._handler:
-                await self._handler.stop()
-
+            # Withdraw the handler before closing it, so get_handler() never
+            # returns one that is shutting down.
+            handler = self._handler
+            self._handler = None
             self._started = False
+            if handler is not None:
+                await handler.stop()
             _LOGGER.info("Global Keba UDP manager stopped")
 
     def get_handler(self) -> KebaUdpHandler:
@@ -120,24 +127,24 @@ class KebaUdpManager:
 
         return self._handler
 
-    async def register_client(self):
+    def register_client(self):
         """Register a client that will use the shared handler.
 
         This increments the client count to prevent premature shutdown.
+        The counter is only touched from the event loop and never across an
+        await, so it needs no lock.
         """
-        async with self._lock:
-            self._client_count += 1
-            _LOGGER.debug(f"Client registered, total clients: {self._client_count}")
+        self._client_count += 1
+        _LOGGER.debug("Client registered, total clients: %d", self._client_count)
 
-    async def unregister_client(self):
+    def unregister_client(self):
         """Unregister a client.
 
         This decrements the client count.
         """
-        async with self._lock:
-            if self._client_count > 0:
-                self._client_count -= 1
-                _LOGGER.debug(f"Client unregistered, total clients: {self._client_count}")
+        if self._client_count > 0:
+            self._client_count -= 1
+            _LOGGER.debug("Client unregistered, total clients: %d", self._client_count)
 
     @property
     def poll_lock(self) -> asyncio.Lock:
@@ -1,9 +1,24 @@
 """Keba KeContact protocol definitions and command handling."""
 
-import json
 from enum import Enum
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, Union
+
+try:
+    # Home Assistant ships orjson; the library still works standalone without it.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Report 2 "State" values, indexed by state id
+_STATE_NAMES = (
+    "Starting",
+    "Not ready for charging",
+    "Ready for charging",
+    "Charging",
+    "Error",
+    "Authorization rejected",
+)
 
 
 class KebaCommand(str, Enum):
@@ -21,13 +36,13 @@ class KebaCommand(str, Enum):
     ENABLE = "ena 1"
     DISABLE = "ena 0"
 
-    DISPLAY_TEXT = "display 0 0 0 0 {text}"
+    DISPLAY_TEXT = "display 0 0 0 0 %s"
 
-    CURR = "curr {value}"
+    CURR = "curr %d"
 
-    SETENERGY = "setenergy {energy}"
+    SETENERGY = "setenergy %d"
 
-    OUTPUT = "output {output}"
+    OUTPUT = "output %d"
 
     START = "start"
     STOP = "stop"
@@ -37,43 +52,62 @@ class KebaCommand(str, Enum):
     BROADCAST = "i"
 
 
-@dataclass
 class KebaResponse:
     """Represents a parsed response from a Keba charger.
 
     Keba chargers respond with JSON-formatted data.
     """
 
-    raw_data: str
-    parsed_data: Optional[Dict[str, Any]] = None
-    is_json: bool = False
+    __slots__ = ("_raw", "parsed_data", "is_json")
+
+    def __init__(
+        self,
+        raw_data: Union[bytes, str],
+        parsed_data: Optional[Dict[str, Any]] = None,
+        is_json: bool = False,
+    ):
+        """Initialize the response.
+
+        Args:
+            raw_data: Datagram as received, or its decoded text
+            parsed_data: Parsed JSON object, if the response was JSON
+            is_json: Whether the response was a JSON object
+        """
+        self._raw = raw_data
+        self.parsed_data = parsed_data
+        self.is_json = is_json
+
+    @property
+    def raw_data(self) -> str:
+        """Response text, decoded only when read."""
+        raw = self._raw
+        if isinstance(raw, bytes):
+            return raw.decode('utf-8', 'replace').strip()
+        return raw
 
     @classmethod
-    def from_raw(cls, raw_data: str) -> 'KebaResponse':
+    def from_raw(cls, raw_data: Union[bytes, str]) -> 'KebaResponse':
         """Create a KebaResponse from raw UDP data.
 
         Args:
-            raw_data: Raw string data from UDP (JSON format)
+            raw_data: Datagram bytes or text from UDP (JSON format); bytes
+                are parsed as they are, without decoding them first
 
         Returns:
             Parsed KebaResponse object
         """
-        parsed = None
-        is_json = False
-
-        stripped = raw_data.strip()
-        if stripped.startswith('{') and stripped.endswith('}'):
-            try:
-                parsed = json.loads(stripped)
-                is_json = True
-            except json.JSONDecodeError:
-                pass
-
-        return cls(
-            raw_data=raw_data,
-            parsed_data=parsed,
-            is_json=is_json
-        )
+        # Report replies are JSON; only command acknowledgements such as
+        # "TCH-OK :done" take the exception path. Both parsers raise a
+        # ValueError subclass, including for bytes that are not UTF-8.
+        try:
+            parsed = _json_loads(raw_data)
+        except ValueError:
+            return cls(raw_data)
+
+        if not isinstance(parsed, dict):
+            return cls(raw_data)
+
+        return cls(raw_data, parsed_data=parsed, is_json=True)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from parsed JSON data.
@@ -98,25 +132,39 @@ class KebaResponse:
 class Report1:
     """Report 1 - Product information and serial."""
 
-    def __init__(self, data: Dict[str, Any]):
-        self.product = data.get("Product")
-        self.serial = data.get("Serial")
-        self.firmware = data.get("Firmware")
-        self.com_module = data.get("COM-module")
-        self.backend = data.get("Backend")
-        self.dip_switch_1 = data.get("DIP-Sw1")
-        self.dip_switch_2 = data.get("DIP-Sw2")
+    __slots__ = (
+        "product",
+        "serial",
+        "firmware",
+        "com_module",
+        "backend",
+        "dip_switch_1",
+        "dip_switch_2",
+        "auth_required",
+    )
 
-    @property
-    def auth_required(self) -> bool:
-        """Check if authentication is required (DIP-Sw2 bit 4)."""
-        if self.dip_switch_2 is not None:
-            try:
-                dip_value = int(self.dip_switch_2) if isinstance(self.dip_switch_2, str) else self.dip_switch_2
-                return bool(dip_value & 0x10)
-            except (ValueError, TypeError):
-                return False
-        return False
+    def __init__(self, data: Dict[str, Any]):
+        get = data.get
+        self.product = get("Product")
+        self.serial = get("Serial")
+        self.firmware = get("Firmware")
+        self.com_module = get("COM-module")
+        self.backend = get("Backend")
+        self.dip_switch_1 = get("DIP-Sw1")
+        self.dip_switch_2 = get("DIP-Sw2")
+        # Authentication required (DIP-Sw2 bit 4)
+        self.auth_required = self._dip_bit(self.dip_switch_2, 0x10)
+
+    @staticmethod
+    def _dip_bit(dip_switch: Any, mask: int) -> bool:
+        """Check a bit in a DIP switch value, which may be reported as a string."""
+        if dip_switch is None:
+            return False
+        try:
+            dip_value = int(dip_switch) if isinstance(dip_switch, str) else dip_switch
+            return bool(dip_value & mask)
+        except (ValueError, TypeError):
+            return False
 
     def __repr__(self):
         return f"Report1(product={self.product}, serial={self.serial}, firmware={self.firmware})"
@@ -125,68 +173,75 @@ class Report1:
 class Report2:
     """Report 2 - Current state of the charging station."""
 
+    __slots__ = (
+        "state",
+        "error_1",
+        "error_2",
+        "plug",
+        "enable_sys",
+        "enable_user",
+        "max_curr",
+        "max_curr_percent",
+        "curr_hw",
+        "curr_user",
+        "curr_fs",
+        "tmo_fs",
+        "curr_timer",
+        "tmo_ct",
+        "setenergy",
+        "output",
+        "input",
+        "serial",
+        "sec",
+        "authreq",
+        "authon",
+        "x2_phase_switch",
+    )
+
     def __init__(self, data: Dict[str, Any]):
-        self.state = data.get("State")
-        self.error_1 = data.get("Error1")
-        self.error_2 = data.get("Error2")
-        self.plug = data.get("Plug")
-        self.enable_sys = data.get("Enable sys")
-        self.enable_user = data.get("Enable user")
-        self.max_curr = data.get("Max curr")
-        self.max_curr_percent = data.get("Max curr %")
-        self.curr_hw = data.get("Curr HW")
-        self.curr_user = data.get("Curr user")
-        self.curr_fs = data.get("Curr FS")
-        self.tmo_fs = data.get("Tmo FS")
-        self.curr_timer = data.get("Curr timer")
-        self.tmo_ct = data.get("Tmo CT")
-        self.setenergy = data.get("Setenergy")
-        self.output = data.get("Output")
-        self.input = data.get("Input")
-        self.serial = data.get("Serial")
-        self.sec = data.get("Sec")
+        get = data.get
+        self.state = get("State")
+        self.error_1 = get("Error1")
+        self.error_2 = get("Error2")
+        self.plug = get("Plug")
+        self.enable_sys = get("Enable sys")
+        self.enable_user = get("Enable user")
+        self.max_curr = get("Max curr")
+        self.max_curr_percent = get("Max curr %")
+        self.curr_hw = get("Curr HW")
+        self.curr_user = get("Curr user")
+        self.curr_fs = get("Curr FS")
+        self.tmo_fs = get("Tmo FS")
+        self.curr_timer = get("Curr timer")
+        self.tmo_ct = get("Tmo CT")
+        self.setenergy = get("Setenergy")
+        self.output = get("Output")
+        self.input = get("Input")
+        self.serial = get("Serial")
+        self.sec = get("Sec")
+
+        inputs = self.input or 0
+        # Authentication required (Input bit 4)
+        self.authreq = bool(inputs & 0x10)
+        # Authentication enabled (Input bit 3)
+        self.authon = bool(inputs & 0x08)
+        # X2 phase switch status (Input bit 5)
+        self.x2_phase_switch = bool(inputs & 0x20)
 
     @property
     def failsafe_mode(self) -> bool:
         """Check if failsafe mode is active (Curr FS > 0)."""
         return self.curr_fs is not None and self.curr_fs > 0
 
-    @property
-    def authreq(self) -> bool:
-        """Check if authentication is required (Input bit 4)."""
-        if self.input is not None:
-            return bool(self.input & 0x10)
-        return False
-
-    @property
-    def authon(self) -> bool:
-        """Check if authentication is enabled (Input bit 3)."""
-        if self.input is not None:
-            return bool(self.input & 0x08)
-        return False
-
-    @property
-    def x2_phase_switch(self) -> bool:
-        """Check X2 phase switch status (Input bit 5)."""
-        if self.input is not None:
-            return bool(self.input & 0x20)
-        return False
-
     @property
     def state_details(self) -> str:
         """Get detailed state description."""
-        if self.state is None:
+        state = self.state
+        if state is None:
             return "Unknown"
-
-        state_map = {
-            0: "Starting",
-            1: "Not ready for charging",
-            2: "Ready for charging",
-            3: "Charging",
-            4: "Error",
-            5: "Authorization rejected"
-        }
-        return state_map.get(self.state, f"Unknown state {self.state}")
+        if isinstance(state, int) and 0 <= state < len(_STATE_NAMES):
+            return _STATE_NAMES[state]
+        return f"Unknown state {state}"
 
     def __repr__(self):
         return f"Report2(state={self.state}, plug={self.plug}, max_curr={self.max_curr})"
@@ -195,19 +250,35 @@ class Report2:
 class Report3:
     """Report 3 - Power and energy measurements."""
 
+    __slots__ = (
+        "u1",
+        "u2",
+        "u3",
+        "i1",
+        "i2",
+        "i3",
+        "p",
+        "pf",
+        "e_pres",
+        "e_total",
+        "serial",
+        "sec",
+    )
+
     def __init__(self, data: Dict[str, Any]):
-        self.u1 = data.get("U1")
-        self.u2 = data.get("U2")
-        self.u3 = data.get("U3")
-        self.i1 = data.get("I1")
-        self.i2 = data.get("I2")
-        self.i3 = data.get("I3")
-        self.p = data.get("P")
-        self.pf = data.get("PF")
-        self.e_pres = data.get("E pres")
-        self.e_total = data.get("E total")
-        self.serial = data.get("Serial")
-        self.sec = data.get("Sec")
+        get = data.get
+        self.u1 = get("U1")
+        self.u2 = get("U2")
+        self.u3 = get("U3")
+        self.i1 = get("I1")
+        self.i2 = get("I2")
+        self.i3 = get("I3")
+        self.p = get("P")
+        self.pf = get("PF")
+        self.e_pres = get("E pres")
+        self.e_total = get("E total")
+        self.serial = get("Serial")
+        self.sec = get("Sec")
 
     @property
     def power_kw(self) -> Optional[float]:
@@ -237,18 +308,33 @@ class Report3:
 class Report100:
     """Report 100 - Session information for RFID."""
 
+    __slots__ = (
+        "session_id",
+        "curr_hw",
+        "e_start",
+        "e_pres",
+        "started",
+        "ended",
+        "reason",
+        "rfid_tag",
+        "rfid_class",
+        "serial",
+        "sec",
+    )
+
     def __init__(self, data: Dict[str, Any]):
-        self.session_id = data.get("Session ID")
-        self.curr_hw = data.get("Curr HW")
-        self.e_start = data.get("E start")
-        self.e_pres = data.get("E pres")
-        self.started = data.get("started")
-        self.ended = data.get("ended")
-        self.reason = data.get("reason")
-        self.rfid_tag = data.get("RFID tag")
-        self.rfid_class = data.get("RFID class")
-        self.serial = data.get("Serial")
-        self.sec = data.get("Sec")
+        get = data.get
+        self.session_id = get("Session ID")
+        self.curr_hw = get("Curr HW")
+        self.e_start = get("E start")
+        self.e_pres = get("E pres")
+        self.started = get("started")
+        self.ended = get("ended")
+        self.reason = get("reason")
+        self.rfid_tag = get("RFID tag")
+        self.rfid_class = get("RFID class")
+        self.serial = get("Serial")
+        self.sec = get("Sec")
 
     @property
     def e_start_kwh(self) -> Optional[float]:
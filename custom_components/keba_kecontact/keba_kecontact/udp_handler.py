@@ -2,8 +2,7 @@
 
 import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Optional, Callable, Dict
+from typing import Optional, Callable, Dict, NamedTuple, Tuple, Union
 import json
 
 _LOGGER = logging.getLogger(__name__)
@@ -11,14 +10,26 @@ _LOGGER = logging.getLogger(__name__)
 KEBA_UDP_PORT = 7090
 
 
-@dataclass
-class UdpMessage:
+def encode_message(message: str) -> bytes:
+    """Encode a command for the charger, which expects code page 437."""
+    # Only display text can contain characters outside ASCII, which cp437
+    # shares byte for byte.
+    if message.isascii():
+        return message.encode('ascii')
+    return message.encode('cp437', 'ignore')
+
+
+class UdpMessage(NamedTuple):
     """Represents a UDP message with IP information."""
 
     ip_address: str
-    data: str
     raw_bytes: bytes
 
+    @property
+    def data(self) -> str:
+        """Decoded message text, decoded only when read."""
+        return self.raw_bytes.decode('utf-8', 'replace').strip()
+
 
 class KebaUdpHandler:
     """Handles UDP communication with multiple Keba chargers on port 7090.
@@ -36,7 +47,7 @@ class KebaUdpHandler:
         self._local_ip = local_ip
         self._transport: Optional[asyncio.DatagramTransport] = None
         self._protocol: Optional['KebaUdpProtocol'] = None
-        self._callbacks: Dict[str, Callable[[UdpMessage], None]] = {}
+        self._callbacks: Dict[str, Tuple[Callable[[UdpMessage], None], ...]] = {}
         self._running = False
 
     async def start(self):
@@ -52,7 +63,7 @@ class KebaUdpHandler:
         )
 
         self._running = True
-        _LOGGER.info(f"UDP handler started on {self._local_ip}:{KEBA_UDP_PORT}")
+        _LOGGER.info("UDP handler started on %s:%s", self._local_ip, KEBA_UDP_PORT)
 
     async def stop(self):
         """Stop the UDP handler."""
@@ -69,36 +80,50 @@ class KebaUdpHandler:
     def register_callback(self, ip_address: str, callback: Callable[[UdpMessage], None]):
         """Register a callback for messages from a specific IP address.
 
+        Several callbacks may be registered for one IP address, for example a
+        config flow probing a charger that is already set up; each of them
+        receives every message from that address.
+
         Args:
             ip_address: IP address of the Keba charger
             callback: Function to call when a message is received from this IP
         """
-        self._callbacks[ip_address] = callback
-        _LOGGER.debug(f"Registered callback for {ip_address}")
+        self._callbacks[ip_address] = self._callbacks.get(ip_address, ()) + (callback,)
+        _LOGGER.debug("Registered callback for %s", ip_address)
 
-    def unregister_callback(self, ip_address: str):
-        """Unregister callback for a specific IP address.
+    def unregister_callback(
+        self,
+        ip_address: str,
+        callback: Optional[Callable[[UdpMessage], None]] = None,
+    ):
+        """Unregister callbacks for a specific IP address.
 
         Args:
             ip_address: IP address to unregister
+            callback: Callback to remove, or None to remove all callbacks
+                for this IP address
         """
-        if ip_address in self._callbacks:
-            del self._callbacks[ip_address]
-            _LOGGER.debug(f"Unregistered callback for {ip_address}")
-
-    async def send_message(self, ip_address: str, message: str):
+        callbacks = self._callbacks.pop(ip_address, ())
+        if callback is not None:
+            remaining = tuple(cb for cb in callbacks if cb != callback)
+            if remaining:
+                self._callbacks[ip_address] = remaining
+        _LOGGER.debug("Unregistered callback for %s", ip_address)
+
+    async def send_message(self, ip_address: str, message: Union[str, bytes]):
         """Send a message to a specific Keba charger.
 
         Args:
             ip_address: IP address of the target charger
-            message: Message to send
+            message: Message to send, either text or already encoded with
+                encode_message()
         """
         if not self._running or not self._transport:
             raise RuntimeError("UDP handler is not running")
 
-        data = message.encode('cp437', 'ignore')
+        data = message if isinstance(message, bytes) else encode_message(message)
         self._transport.sendto(data, (ip_address, KEBA_UDP_PORT))
-        _LOGGER.debug(f"Sent to {ip_address}: {message}")
+        _LOGGER.debug("Sent to %s: %s", ip_address, message)
 
     def _on_message_received(self, data: bytes, addr: tuple):
         """Internal callback when a message is received.
@@ -109,23 +134,15 @@ class KebaUdpHandler:
         """
         ip_address = addr[0]
 
-        try:
-            decoded = data.decode('utf-8').strip()
-            message = UdpMessage(
-                ip_address=ip_address,
-                data=decoded,
-                raw_bytes=data
-            )
-
-            _LOGGER.debug(f"Received from {ip_address}: {decoded}")
-
-            if ip_address in self._callbacks:
-                self._callbacks[ip_address](message)
-            else:
-                _LOGGER.warning(f"No callback registered for {ip_address}, message ignored")
+        callbacks = self._callbacks.get(ip_address)
+        if not callbacks:
+            _LOGGER.warning("No callback registered for %s, message ignored", ip_address)
+            return
 
-        except UnicodeDecodeError:
-            _LOGGER.error(f"Failed to decode message from {ip_address}: {data.hex()}")
+        _LOGGER.debug("Received from %s: %r", ip_address, data)
+        message = UdpMessage(ip_address=ip_address, raw_bytes=data)
+        for callback in callbacks:
+            callback(message)
 
 
 class KebaUdpProtocol(asyncio.DatagramProtocol):
@@ -135,28 +152,20 @@ class KebaUdpProtocol(asyncio.DatagramProtocol):
         """Initialize the protocol.
 
         Args:
-            message_callback: Function to call when a message is received
+            message_callback: Function to call when a message is received,
+                bound directly as this protocol's datagram_received handler
         """
-        self._message_callback = message_callback
+        self.datagram_received = message_callback
 
     def connection_made(self, transport):
         """Called when connection is established."""
         self.transport = transport
 
-    def datagram_received(self, data: bytes, addr: tuple):
-        """Called when a datagram is received.
-
-        Args:
-            data: Raw bytes received
-            addr: (ip, port) tuple of sender
-        """
-        self._message_callback(data, addr)
-
     def error_received(self, exc):
         """Called when an error is received."""
-        _LOGGER.error(f"UDP error: {exc}")
+        _LOGGER.error("UDP error: %s", exc)
 
     def connection_lost(self, exc):
         """Called when connection is lost."""
         if exc:
-            _LOGGER.error(f"UDP connection lost: {exc}")
+            _LOGGER.error("UDP connection lost: %s", exc)
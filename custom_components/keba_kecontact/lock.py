@@ -6,7 +6,7 @@ from typing import Any
 
 from homeassistant.components.lock import LockEntity, LockEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -14,6 +14,15 @@ from .const import DOMAIN, CONF_RFID, CONF_RFID_CLASS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Charger states with no charging session: starting, not ready and ready
+LOCKED_STATES = frozenset({0, 1, 2})
+
+
+def _is_locked(data: dict[str, Any] | None) -> bool:
+    """Return true if no charging session is running."""
+    state = (data or {}).get("state")
+    return state is None or state in LOCKED_STATES
+
 LOCK_DESCRIPTION = LockEntityDescription(
     key="authentication",
     name="Authentication",
@@ -26,9 +35,6 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Keba KeContact lock based on a config entry."""
-    from .sensor import KebaDataUpdateCoordinator
-    from homeassistant.helpers.entity import DeviceInfo
-
     data = hass.data[DOMAIN][entry.entry_id]
 
     if data.get("type") == "charging_coordinator":
@@ -85,14 +91,13 @@ class KebaLock(CoordinatorEntity, LockEntity):
         self._client = client
         self._rfid_tag = rfid_tag or "00000000"
         self._rfid_class = rfid_class or "00000000000000000000"
+        self._attr_is_locked = _is_locked(coordinator.data)
 
-    @property
-    def is_locked(self) -> bool:
-        """Return true if the lock is locked."""
-        state = self.coordinator.data.get("state")
-        if state is None:
-            return True
-        return state in [0, 1, 2]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the cached lock state from the coordinator."""
+        self._attr_is_locked = _is_locked(self.coordinator.data)
+        super()._handle_coordinator_update()
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the charger (stop charging session)."""
@@ -78,6 +78,15 @@ class KebaNotifyEntity(CoordinatorEntity, NotifyEntity):
             raise ServiceValidationError("Message cannot be empty")
 
         text = message.replace(" ", "$")
+        if not text.isascii():
+            # The display uses code page 437 and characters outside it are
+            # dropped when the command is encoded, so drop them before
+            # applying the length limit.
+            text = text.encode("cp437", "ignore").decode("cp437")
+            if not text:
+                raise ServiceValidationError(
+                    "Message contains no characters the display can show"
+                )
 
         if len(text) > MAX_DISPLAY_LENGTH:
             _LOGGER.warning(
@@ -15,6 +15,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .keba_kecontact.client import KebaClient
 
 from .const import DOMAIN
+from .coordinator_number import async_setup_entry as async_setup_coordinator_numbers
 from .sensor import KebaDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,31 +30,10 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
 
     if data.get("type") == "charging_coordinator":
-        from .coordinator_number import async_setup_entry as async_setup_coordinator_numbers
         return await async_setup_coordinator_numbers(hass, entry, async_add_entities)
 
-    if "coordinator" in data:
-        coordinator = data["coordinator"]
-        device_info = data["device_info"]
-    else:
-        client: KebaClient = data["client"]
-        ip_address: str = data["ip_address"]
-
-        coordinator = KebaDataUpdateCoordinator(hass, client)
-        await coordinator.async_config_entry_first_refresh()
-
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, ip_address)},
-            name=f"Keba KeContact {ip_address}",
-            manufacturer="Keba",
-            model=coordinator.data.get("product", "KeContact"),
-            sw_version=coordinator.data.get("firmware"),
-            serial_number=coordinator.data.get("serial"),
-        )
-
-        data["coordinator"] = coordinator
-        data["device_info"] = device_info
-
+    coordinator = data["coordinator"]
+    device_info = data["device_info"]
     client: KebaClient = data["client"]
 
     entities = [
@@ -18,6 +18,7 @@ from homeassistant.const import (
     UnitOfPower,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -28,8 +29,11 @@ from homeassistant.helpers.update_coordinator import (
 
 from .keba_kecontact.client import KebaClient
 from .keba_kecontact.manager import KebaUdpManager
+from .keba_kecontact.protocol import Report100
 
+from .binary_sensor import compute_binary_sensor_states
 from .const import DOMAIN
+from .coordinator_sensor import async_setup_entry as async_setup_coordinator_sensors
 from .sensor_diagnostic import (
     KebaRFIDTagSensor,
     KebaRFIDClassSensor,
@@ -55,6 +59,7 @@ from .sensor_diagnostic import (
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=10)
+REQUEST_REFRESH_COOLDOWN = 0.5
 
 
 async def async_setup_entry(
@@ -66,7 +71,6 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
 
     if data.get("type") == "charging_coordinator":
-        from .coordinator_sensor import async_setup_entry as async_setup_coordinator_sensors
         return await async_setup_coordinator_sensors(hass, entry, async_add_entities)
 
     coordinator = data["coordinator"]
@@ -124,9 +128,25 @@ class KebaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self._client = client
         self._poll_lock = KebaUdpManager.get_instance().poll_lock
+        self._binary_sensor_keys: set[str] = set()
+        # Report 100 only changes when a session starts or ends, so it is
+        # refetched when state or plug differ from the previous poll.
+        self._session_state: tuple[int | None, int | None] | None = None
+        self._report100: Report100 | None = None
+
+    @property
+    def binary_sensor_keys(self) -> set[str]:
+        """Return the keys of binary sensors currently added to Home Assistant."""
+        return self._binary_sensor_keys
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Keba charger."""
@@ -137,15 +157,19 @@ class KebaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _poll_charger(self) -> dict[str, Any]:
         """Poll charger while holding the shared lock."""
         try:
-            report1 = await self._client.get_report_1()
-            report2 = await self._client.get_report_2()
-            report3 = await self._client.get_report_3()
+            # Keep asking for report 100 until the charger has returned one.
+            fetch_report100 = self._report100 is None
+            report1, report2, report3, report100 = await self._client.get_all_reports(
+                include_report_100=fetch_report100
+            )
 
-            try:
-                report100 = await self._client.get_report_100()
-            except Exception as err:
-                _LOGGER.debug("Could not fetch report 100 (session info): %s", err)
-                report100 = None
+            session_state = (report2.state, report2.plug)
+            if fetch_report100:
+                self._report100 = report100
+            elif session_state != self._session_state:
+                self._report100 = await self._client.get_optional_report_100()
+            self._session_state = session_state
+            report100 = self._report100
 
             data = {
                 "product": report1.product,
@@ -200,6 +224,8 @@ class KebaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     "reason": report100.reason,
                 })
 
+            data["binary_sensors"] = compute_binary_sensor_states(data, self._binary_sensor_keys)
+
             _LOGGER.debug(
                 "Charger %s: state=%s, plug=%s, power=%.2f kW, session_energy=%.2f kWh",
                 self._client.ip_address,
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import logging
 import logging.handlers
+from collections.abc import Mapping
 from datetime import datetime, timedelta, time
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING
 from pathlib import Path
 
@@ -136,9 +138,9 @@ class SmartCharger:
         self._last_error = None
 
     @property
-    def active_plans(self) -> dict[str, ChargingPlan]:
-        """Return all active plans."""
-        return self._active_plans.copy()
+    def active_plans(self) -> Mapping[str, ChargingPlan]:
+        """Return a read-only view of all active plans."""
+        return MappingProxyType(self._active_plans)
 
     def get_plan(self, charger_entry_id: str) -> ChargingPlan | None:
         """Get active plan for a specific charger."""
@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures for Keba KeContact tests."""
 import sys
+from dataclasses import dataclass
 from types import ModuleType
 from unittest.mock import MagicMock
 
@@ -27,14 +28,18 @@ mock_ha.helpers.event = create_mock_module("homeassistant.helpers.event")
 mock_ha.helpers.event.async_track_state_change_event = MagicMock()
 mock_ha.helpers.event.async_track_time_interval = MagicMock()
 
+mock_ha.helpers.debounce = create_mock_module("homeassistant.helpers.debounce")
+
 mock_ha.helpers.entity = create_mock_module("homeassistant.helpers.entity")
 mock_ha.helpers.entity.DeviceInfo = dict
 
+mock_ha.helpers.entity_registry = create_mock_module("homeassistant.helpers.entity_registry")
+
 mock_ha.helpers.entity_platform = create_mock_module("homeassistant.helpers.entity_platform")
 mock_ha.helpers.entity_platform.AddEntitiesCallback = MagicMock
 
 mock_ha.helpers.restore_state = create_mock_module("homeassistant.helpers.restore_state")
-mock_ha.helpers.restore_state.RestoreEntity = MagicMock
+mock_ha.helpers.restore_state.RestoreEntity = type("RestoreEntity", (), {})
 
 mock_ha.helpers.selector = create_mock_module("homeassistant.helpers.selector")
 
@@ -46,6 +51,17 @@ mock_ha.components.sensor.SensorStateClass = MagicMock()
 mock_ha.components.binary_sensor = create_mock_module("homeassistant.components.binary_sensor")
 mock_ha.components.binary_sensor.BinarySensorEntity = MagicMock
 
+
+@dataclass(frozen=True, kw_only=True)
+class FakeEntityDescription:
+    key: str
+    name: str | None = None
+    device_class: str | None = None
+    entity_registry_enabled_default: bool = True
+
+
+mock_ha.components.binary_sensor.BinarySensorEntityDescription = FakeEntityDescription
+
 mock_ha.components.button = create_mock_module("homeassistant.components.button")
 mock_ha.components.button.ButtonEntity = MagicMock
 
@@ -76,6 +92,7 @@ class FakeDataUpdateCoordinator:
 
     def __init__(self, hass=None, *args, **kwargs):
         self.hass = hass
+        self.data = None
 
     async def async_refresh(self):
         pass
@@ -100,7 +117,9 @@ sys.modules["homeassistant.config_entries"] = mock_ha.config_entries
 sys.modules["homeassistant.exceptions"] = mock_ha.exceptions
 sys.modules["homeassistant.helpers"] = mock_ha.helpers
 sys.modules["homeassistant.helpers.event"] = mock_ha.helpers.event
+sys.modules["homeassistant.helpers.debounce"] = mock_ha.helpers.debounce
 sys.modules["homeassistant.helpers.entity"] = mock_ha.helpers.entity
+sys.modules["homeassistant.helpers.entity_registry"] = mock_ha.helpers.entity_registry
 sys.modules["homeassistant.helpers.entity_platform"] = mock_ha.helpers.entity_platform
 sys.modules["homeassistant.helpers.restore_state"] = mock_ha.helpers.restore_state
 sys.modules["homeassistant.helpers.selector"] = mock_ha.helpers.selector
@@ -1,8 +1,10 @@
 """Tests for the KebaChargingCoordinator."""
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
-from custom_components.keba_kecontact.coordinator import KebaChargingCoordinator
+from custom_components.keba_kecontact.coordinator import ChargerSnapshot, KebaChargingCoordinator
 from custom_components.keba_kecontact.const import (
     DOMAIN,
     COORDINATOR_STRATEGY_OFF,
@@ -29,6 +31,7 @@ def _make_charger_entry(mock_hass, entry_id, state=3, power_kw=7.0, serial="1234
         "energy_total_kwh": 500.0,
         "serial": serial,
         "max_curr": 16000,
+        "curr_user": 16000,
         "curr_hw": curr_hw,
     }
     client = AsyncMock()
@@ -69,20 +72,72 @@ class TestCoordinatorInit:
 
 class TestCoordinatorStartStop:
     @pytest.mark.asyncio
-    async def test_start_registers_state_listener(self, coordinator, mock_hass):
+    async def test_start_tracks_charger_state_sensors(self, coordinator, mock_hass):
+        registry = MagicMock()
+        registry.async_get_entity_id.side_effect = lambda domain, platform, unique_id: (
+            "sensor.keba_kecontact_12345_state" if unique_id == "e1_state" else None
+        )
+        coordinator.async_refresh = AsyncMock()
+        with patch("custom_components.keba_kecontact.coordinator.er.async_get", return_value=registry), \
+                patch("custom_components.keba_kecontact.coordinator.async_track_state_change_event") as track:
+            await coordinator.async_start()
+        track.assert_called_once_with(
+            mock_hass, ["sensor.keba_kecontact_12345_state"], coordinator._handle_state_change
+        )
+
+    @pytest.mark.asyncio
+    async def test_late_charger_state_sensor_is_tracked(self, coordinator, mock_hass):
+        registered = {"e1_state": "sensor.charger_1_state"}
+        registry = MagicMock()
+        registry.async_get_entity_id.side_effect = (
+            lambda domain, platform, unique_id: registered.get(unique_id)
+        )
+        unsub = MagicMock()
         coordinator.async_refresh = AsyncMock()
-        await coordinator.async_start()
-        mock_hass.bus.async_listen.assert_called_once()
+        with patch("custom_components.keba_kecontact.coordinator.er.async_get", return_value=registry), \
+                patch("custom_components.keba_kecontact.coordinator.async_track_state_change_event", return_value=unsub) as track:
+            await coordinator.async_start()
+            _make_charger_entry(mock_hass, "e2", state=2)
+            registered["e2_state"] = "sensor.charger_2_state"
+            coordinator._aggregate()
+
+        unsub.assert_called_once()
+        track.assert_called_with(
+            mock_hass,
+            ["sensor.charger_1_state", "sensor.charger_2_state"],
+            coordinator._handle_state_change,
+        )
 
     @pytest.mark.asyncio
     async def test_stop_removes_state_listener(self, coordinator, mock_hass):
         unsub = MagicMock()
-        mock_hass.bus.async_listen.return_value = unsub
         coordinator.async_refresh = AsyncMock()
-        await coordinator.async_start()
+        with patch("custom_components.keba_kecontact.coordinator.async_track_state_change_event", return_value=unsub):
+            await coordinator.async_start()
         await coordinator.async_stop()
         unsub.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stop_cancels_running_rebalance(self, coordinator):
+        task = MagicMock()
+        coordinator._rebalance_task = task
+        await coordinator.async_stop()
+        task.cancel.assert_called_once()
+        assert coordinator._rebalance_task is None
+
+    @pytest.mark.asyncio
+    async def test_off_strategy_stops_tracking(self, coordinator, mock_hass):
+        unsub = MagicMock()
+        coordinator.async_refresh = AsyncMock()
+        coordinator.async_request_refresh = AsyncMock()
+        with patch("custom_components.keba_kecontact.coordinator.async_track_state_change_event", return_value=unsub) as track:
+            await coordinator.async_start()
+            await coordinator.set_strategy(COORDINATOR_STRATEGY_OFF)
+            unsub.assert_called_once()
+
+            await coordinator.set_strategy(COORDINATOR_STRATEGY_EQUAL)
+            assert track.call_count == 2
+
     @pytest.mark.asyncio
     async def test_start_smart_without_nordpool_logs_warning(self, mock_hass):
         coord = KebaChargingCoordinator(
@@ -97,14 +152,14 @@ class TestCoordinatorStartStop:
 class TestCoordinatorDistribution:
     def test_off(self, coordinator):
         coordinator._strategy = COORDINATOR_STRATEGY_OFF
-        result = coordinator._calculate_distribution({})
+        result = coordinator._calculate_distribution(0)
         assert result == "Off - No load balancing"
 
     def test_smart_with_plans(self, coordinator):
         coordinator._strategy = COORDINATOR_STRATEGY_SMART
         coordinator._smart_charger = MagicMock()
         coordinator._smart_charger.active_plans = {"e1": MagicMock()}
-        result = coordinator._calculate_distribution({})
+        result = coordinator._calculate_distribution(0)
         assert "Smart" in result
         assert "1" in result
 
@@ -112,22 +167,20 @@ class TestCoordinatorDistribution:
         coordinator._strategy = COORDINATOR_STRATEGY_SMART
         coordinator._smart_charger = MagicMock()
         coordinator._smart_charger.active_plans = {}
-        result = coordinator._calculate_distribution({})
+        result = coordinator._calculate_distribution(0)
         assert "Waiting" in result
 
     def test_equal_no_active(self, coordinator):
-        result = coordinator._calculate_distribution({})
+        result = coordinator._calculate_distribution(0)
         assert "32A available" in result
 
     def test_equal_one_active(self, coordinator):
-        states = {"e1": {"state": 3}}
-        result = coordinator._calculate_distribution(states)
+        result = coordinator._calculate_distribution(1)
         assert "32A" in result
         assert "to charger" in result
 
     def test_equal_two_active(self, coordinator):
-        states = {"e1": {"state": 3}, "e2": {"state": 3}}
-        result = coordinator._calculate_distribution(states)
+        result = coordinator._calculate_distribution(2)
         assert "16A per charger" in result
 
 
@@ -169,6 +222,31 @@ class TestApplyLoadBalancing:
         client1.set_current.assert_called_once()
         client2.set_current.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_unknown_strategy_restores_user_limits(self, coordinator, mock_hass):
+        coordinator._strategy = "priority"
+        client1 = _make_charger_entry(mock_hass, "e1", state=3, current_limit=20)
+        client2 = _make_charger_entry(mock_hass, "e2", state=1, current_limit=20)
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator._apply_load_balancing()
+
+        client1.set_current.assert_called_once_with(20000)
+        client2.set_current.assert_called_once_with(20000)
+
+    @pytest.mark.asyncio
+    async def test_unknown_strategy_leaves_active_chargers_alone(self, coordinator, mock_hass):
+        coordinator._strategy = "priority"
+        client1 = _make_charger_entry(mock_hass, "e1", state=3)
+        client2 = _make_charger_entry(mock_hass, "e2", state=3)
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator._apply_load_balancing()
+
+        client1.set_current.assert_not_called()
+        client2.set_current.assert_not_called()
+        coordinator.async_request_refresh.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_equal_two_active_splits(self, coordinator, mock_hass):
         client1 = _make_charger_entry(mock_hass, "e1", state=3)
@@ -191,6 +269,49 @@ class TestApplyLoadBalancing:
         client1.set_current.assert_called_once_with(10000)
         client2.set_current.assert_called_once_with(16000)
 
+    @pytest.mark.asyncio
+    async def test_equal_failure_does_not_block_other_chargers(self, coordinator, mock_hass):
+        client1 = _make_charger_entry(mock_hass, "e1", state=3)
+        client2 = _make_charger_entry(mock_hass, "e2", state=3)
+        client1.set_current.side_effect = Exception("UDP error")
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator._apply_load_balancing()
+
+        client2.set_current.assert_called_once_with(16000)
+        client2.display_text.assert_called_once()
+        client1.display_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_allocation_not_resent(self, coordinator, mock_hass):
+        client1 = _make_charger_entry(mock_hass, "e1", state=3)
+        client2 = _make_charger_entry(mock_hass, "e2", state=3)
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator._apply_load_balancing()
+        await coordinator._apply_load_balancing()
+
+        client1.set_current.assert_called_once_with(16000)
+        client2.set_current.assert_called_once_with(16000)
+
+        await coordinator.set_max_current(20)
+
+        client1.set_current.assert_called_with(10000)
+        client2.set_current.assert_called_with(10000)
+
+    @pytest.mark.asyncio
+    async def test_allocation_resent_when_charger_reports_other_current(self, coordinator, mock_hass):
+        client1 = _make_charger_entry(mock_hass, "e1", state=3)
+        client2 = _make_charger_entry(mock_hass, "e2", state=3)
+        coordinator.async_request_refresh = AsyncMock()
+
+        await coordinator._apply_load_balancing()
+        mock_hass.data[DOMAIN]["e1"]["coordinator"].data["curr_user"] = 32000
+        await coordinator._apply_load_balancing()
+
+        assert client1.set_current.call_count == 2
+        client2.set_current.assert_called_once_with(16000)
+
     @pytest.mark.asyncio
     async def test_equal_insufficient_current_warns(self, coordinator, mock_hass):
         coordinator._max_current = 5
@@ -208,7 +329,7 @@ class TestRestoreChargers:
     @pytest.mark.asyncio
     async def test_restore_uses_user_limit(self, coordinator, mock_hass):
         client = _make_charger_entry(mock_hass, "e1", state=1, current_limit=20)
-        charger_states = {"e1": {"state": 1, "client": client}}
+        charger_states = {"e1": ChargerSnapshot(state=1, client=client)}
 
         await coordinator._restore_all_chargers_to_user_limits(charger_states)
 
@@ -217,7 +338,7 @@ class TestRestoreChargers:
     @pytest.mark.asyncio
     async def test_restore_caps_to_hw_limit(self, coordinator, mock_hass):
         client = _make_charger_entry(mock_hass, "e1", state=1, current_limit=32, curr_hw=16000)
-        charger_states = {"e1": {"state": 1, "client": client}}
+        charger_states = {"e1": ChargerSnapshot(state=1, client=client)}
 
         await coordinator._restore_all_chargers_to_user_limits(charger_states)
 
@@ -227,7 +348,7 @@ class TestRestoreChargers:
     async def test_restore_skips_no_config_entry(self, coordinator, mock_hass):
         client = AsyncMock()
         mock_hass.data[DOMAIN]["e1"] = {}
-        charger_states = {"e1": {"state": 1, "client": client}}
+        charger_states = {"e1": ChargerSnapshot(state=1, client=client)}
 
         await coordinator._restore_all_chargers_to_user_limits(charger_states)
         client.set_current.assert_not_called()
@@ -235,7 +356,7 @@ class TestRestoreChargers:
     @pytest.mark.asyncio
     async def test_restore_sends_display_message(self, coordinator, mock_hass):
         client = _make_charger_entry(mock_hass, "e1", state=1, current_limit=16)
-        charger_states = {"e1": {"state": 1, "client": client}}
+        charger_states = {"e1": ChargerSnapshot(state=1, client=client)}
 
         await coordinator._restore_all_chargers_to_user_limits(charger_states)
         client.display_text.assert_called_once()
@@ -244,7 +365,7 @@ class TestRestoreChargers:
     async def test_restore_handles_client_error(self, coordinator, mock_hass):
         client = _make_charger_entry(mock_hass, "e1", state=1)
         client.set_current.side_effect = Exception("UDP error")
-        charger_states = {"e1": {"state": 1, "client": client}}
+        charger_states = {"e1": ChargerSnapshot(state=1, client=client)}
 
         await coordinator._restore_all_chargers_to_user_limits(charger_states)
 
@@ -294,25 +415,63 @@ class TestStrategy:
         await coordinator.set_max_current(16)
         assert coordinator.max_current == 16
 
+    @pytest.mark.asyncio
+    async def test_set_max_current_waits_for_running_pass(self, coordinator, mock_hass):
+        coordinator.async_request_refresh = AsyncMock()
+        client1 = _make_charger_entry(mock_hass, "e1", state=3)
+        _make_charger_entry(mock_hass, "e2", state=3)
+        release = asyncio.Event()
+        sent = []
+
+        async def set_current(current_ma):
+            sent.append(current_ma)
+            if len(sent) == 1:
+                await release.wait()
+
+        client1.set_current.side_effect = set_current
+        running = asyncio.create_task(coordinator._apply_load_balancing())
+        await asyncio.sleep(0)
+        update = asyncio.create_task(coordinator.set_max_current(20))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert sent == [16000]
+        release.set()
+        await asyncio.gather(running, update)
+
+        assert sent == [16000, 10000]
+
 
 class TestHandleStateChange:
-    def test_keba_state_triggers_rebalance(self, coordinator, mock_hass):
+    def test_keba_state_schedules_rebalance(self, coordinator, mock_hass):
         event = MagicMock()
         event.data = {"entity_id": "sensor.keba_kecontact_12345_state"}
         coordinator._handle_state_change(event)
-        mock_hass.async_create_task.assert_called_once()
+        mock_hass.loop.call_later.assert_called_once()
 
-    def test_non_keba_ignored(self, coordinator, mock_hass):
+    def test_burst_coalesced_into_one_rebalance(self, coordinator, mock_hass):
         event = MagicMock()
-        event.data = {"entity_id": "sensor.weather_temperature"}
-        coordinator._handle_state_change(event)
-        mock_hass.async_create_task.assert_not_called()
+        event.data = {"entity_id": "sensor.keba_kecontact_12345_state"}
+        for _ in range(5):
+            coordinator._handle_state_change(event)
+        mock_hass.loop.call_later.assert_called_once()
+
+        scheduled_callback = mock_hass.loop.call_later.call_args[0][1]
+        scheduled_callback()
+        mock_hass.async_create_task.assert_called_once()
 
-    def test_keba_non_state_ignored(self, coordinator, mock_hass):
-        event = MagicMock()
-        event.data = {"entity_id": "sensor.keba_kecontact_12345_power"}
         coordinator._handle_state_change(event)
+        assert mock_hass.loop.call_later.call_count == 2
+
+    def test_running_pass_defers_next_rebalance(self, coordinator, mock_hass):
+        running = MagicMock()
+        running.done.return_value = False
+        coordinator._rebalance_task = running
+
+        coordinator._run_scheduled_rebalance()
+
         mock_hass.async_create_task.assert_not_called()
+        mock_hass.loop.call_later.assert_called_once()
 
 
 class TestUpdateData:
@@ -330,6 +489,55 @@ class TestUpdateData:
         result = await coordinator._async_update_data()
         assert result["active_chargers"] == 1
 
+    @pytest.mark.asyncio
+    async def test_child_update_pushes_aggregate(self, coordinator, mock_hass):
+        _make_charger_entry(mock_hass, "e1", state=3, power_kw=7.0)
+        _make_charger_entry(mock_hass, "e2", state=1, power_kw=0.0)
+        coordinator.async_set_updated_data = MagicMock()
+
+        await coordinator._async_update_data()
+        child = mock_hass.data[DOMAIN]["e1"]["coordinator"]
+        child.async_add_listener.assert_called_once_with(coordinator._handle_child_update)
+
+        child.data["power_kw"] = 11.0
+        coordinator._handle_child_update()
+
+        data = coordinator.async_set_updated_data.call_args[0][0]
+        assert data["total_power"] == pytest.approx(11.0)
+        child.async_add_listener.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_child_update_not_published(self, coordinator, mock_hass):
+        _make_charger_entry(mock_hass, "e1", state=1)
+        coordinator.async_set_updated_data = MagicMock()
+        coordinator.data = await coordinator._async_update_data()
+
+        coordinator._handle_child_update()
+
+        coordinator.async_set_updated_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reloaded_charger_is_resubscribed(self, coordinator, mock_hass):
+        _make_charger_entry(mock_hass, "e1", state=1)
+        await coordinator._async_update_data()
+        old_child = mock_hass.data[DOMAIN]["e1"]["coordinator"]
+        remove_listener = old_child.async_add_listener.return_value
+
+        _make_charger_entry(mock_hass, "e1", state=1)
+        await coordinator._async_update_data()
+
+        remove_listener.assert_called_once()
+        mock_hass.data[DOMAIN]["e1"]["coordinator"].async_add_listener.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_active_count_change_schedules_rebalance(self, coordinator, mock_hass):
+        _make_charger_entry(mock_hass, "e1", state=3)
+        _make_charger_entry(mock_hass, "e2", state=3)
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+        mock_hass.loop.call_later.assert_called_once()
+        mock_hass.async_create_task.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_skips_missing_entries(self, coordinator, mock_hass):
         _make_charger_entry(mock_hass, "e1", state=1)
@@ -76,12 +76,13 @@ class TestSmartChargerInit:
         assert charger._active_plans == {}
         assert charger.last_error is None
 
-    def test_active_plans_returns_copy(self, charger):
+    def test_active_plans_is_read_only(self, charger):
         plan = MagicMock()
         charger._active_plans["e1"] = plan
-        copy = charger.active_plans
-        copy.pop("e1")
-        assert "e1" in charger._active_plans
+        plans = charger.active_plans
+        with pytest.raises(TypeError):
+            plans["e2"] = plan
+        assert plans["e1"] is plan
 
     def test_get_plan_none(self, charger):
         assert charger.get_plan("nonexistent") is None